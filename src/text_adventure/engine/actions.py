@@ -781,23 +781,20 @@ def _execute_custom_action_with_hint(
     return None
 
 
+def _apply_state_changes(action: ObjectAction, state: GameState) -> None:
+    """Apply an action's state changes, using the plan precomputed at load time."""
+    for obj_id, attr, value in action.state_change_plan:
+        if obj_id is None:
+            state.set_flag(attr, value)
+        else:
+            obj_state = state.objects.get(obj_id)
+            if obj_state and hasattr(obj_state, attr):
+                setattr(obj_state, attr, value)
+
+
 def _apply_action_effects(action: "ObjectAction", state: GameState) -> ActionResult:
     """Apply the effects of an action and return the result."""
-    # Apply state changes
-    for key, value in action.state_changes.items():
-        if "." in key:
-            # Object state change (e.g., "door.locked")
-            obj_id, attr = key.split(".", 1)
-            # Handle flags.flag_name syntax
-            if obj_id == "flags":
-                state.set_flag(attr, value)
-            else:
-                obj_state = state.objects.get(obj_id)
-                if obj_state and hasattr(obj_state, attr):
-                    setattr(obj_state, attr, value)
-        else:
-            # Flag change
-            state.set_flag(key, value)
+    _apply_state_changes(action, state)
 
     # Reveal object if specified
     if action.reveals_object:
@@ -922,21 +919,7 @@ def _execute_custom_action(
             success=False,
         )
 
-    # Apply state changes
-    for key, value in action.state_changes.items():
-        if "." in key:
-            # Object state change (e.g., "door.locked") or flag (e.g., "flags.talked")
-            obj_id, attr = key.split(".", 1)
-            # Handle flags.flag_name syntax
-            if obj_id == "flags":
-                state.set_flag(attr, value)
-            else:
-                obj_state = state.objects.get(obj_id)
-                if obj_state and hasattr(obj_state, attr):
-                    setattr(obj_state, attr, value)
-        else:
-            # Flag change
-            state.set_flag(key, value)
+    _apply_state_changes(action, state)
 
     # Reveal object if specified
     if action.reveals_object:
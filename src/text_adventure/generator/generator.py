@@ -139,7 +139,8 @@ class GameGenerator:
         # Validate with Pydantic
         return Game.model_validate(transformed)
 
-    def _transform_game_data(self, data: dict[str, Any]) -> dict[str, Any]:
+    @classmethod
+    def _transform_game_data(cls, data: dict[str, Any]) -> dict[str, Any]:
         """
         Transform LLM output to match our Pydantic model expectations.
 
@@ -169,15 +170,15 @@ class GameGenerator:
         object_id_map: dict[str, str] = {}
 
         if "rooms" in result:
-            result["rooms"], room_id_map = self._sanitize_room_ids(result["rooms"])
+            result["rooms"], room_id_map = cls._sanitize_room_ids(result["rooms"])
         if "objects" in result:
-            result["objects"], object_id_map = self._sanitize_object_ids(
+            result["objects"], object_id_map = cls._sanitize_object_ids(
                 result["objects"], room_id_map
             )
             # Fix malformed action objects
-            result["objects"] = self._fix_object_actions(result["objects"])
+            result["objects"] = cls._fix_object_actions(result["objects"])
             # Ensure objects revealed by actions are initially hidden
-            result["objects"] = self._fix_revealed_objects_hidden(result["objects"])
+            result["objects"] = cls._fix_revealed_objects_hidden(result["objects"])
 
         # Update room.objects to use sanitized object IDs
         if "rooms" in result and object_id_map:
@@ -187,7 +188,7 @@ class GameGenerator:
 
         # Ensure objects have locations and rooms only reference existing objects
         if "objects" in result and "rooms" in result:
-            result["objects"] = self._fix_object_locations(
+            result["objects"] = cls._fix_object_locations(
                 result["objects"],
                 result["rooms"],
             )
@@ -196,7 +197,7 @@ class GameGenerator:
                 f"Before fix_room_object_references: {len(result['rooms'])} rooms, {len(result['objects'])} objects"
             )
             logger.debug(f"Object IDs: {[obj.get('id') for obj in result['objects']]}")
-            result["rooms"] = self._fix_room_object_references(
+            result["rooms"] = cls._fix_room_object_references(
                 result["rooms"],
                 result["objects"],
             )
@@ -237,11 +238,12 @@ class GameGenerator:
 
         # Add default verbs if missing
         if "verbs" not in result or not result["verbs"]:
-            result["verbs"] = self._default_verbs()
+            result["verbs"] = cls._default_verbs()
 
         return result
 
-    def _sanitize_id(self, raw_id: str) -> str:
+    @staticmethod
+    def _sanitize_id(raw_id: str) -> str:
         """
         Sanitize an ID to match the pattern ^[a-z][a-z0-9_]*$.
 
@@ -271,8 +273,9 @@ class GameGenerator:
 
         return sanitized
 
+    @classmethod
     def _sanitize_room_ids(
-        self,
+        cls,
         rooms: list[dict[str, Any]],
     ) -> tuple[list[dict[str, Any]], dict[str, str]]:
         """Sanitize room IDs and update exit references.
@@ -285,7 +288,7 @@ class GameGenerator:
         # First pass: collect ID mappings
         for room in rooms:
             old_id = room.get("id", "")
-            new_id = self._sanitize_id(old_id)
+            new_id = cls._sanitize_id(old_id)
             if old_id != new_id:
                 id_map[old_id] = new_id
                 logger.debug(f"Sanitizing room ID: '{old_id}' -> '{new_id}'")
@@ -319,8 +322,8 @@ class GameGenerator:
 
         return fixed_rooms, id_map
 
+    @staticmethod
     def _fix_object_actions(
-        self,
         objects: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
         """
@@ -360,8 +363,8 @@ class GameGenerator:
             fixed_objects.append(obj)
         return fixed_objects
 
+    @staticmethod
     def _fix_revealed_objects_hidden(
-        self,
         objects: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
         """
@@ -396,8 +399,9 @@ class GameGenerator:
             fixed_objects.append(obj)
         return fixed_objects
 
+    @classmethod
     def _sanitize_object_ids(
-        self,
+        cls,
         objects: list[dict[str, Any]],
         room_id_map: dict[str, str],
     ) -> tuple[list[dict[str, Any]], dict[str, str]]:
@@ -415,7 +419,7 @@ class GameGenerator:
         # First pass: collect ID mappings
         for obj in objects:
             old_id = obj.get("id", "")
-            new_id = self._sanitize_id(old_id)
+            new_id = cls._sanitize_id(old_id)
             if old_id != new_id:
                 id_map[old_id] = new_id
                 logger.debug(f"Sanitizing object ID: '{old_id}' -> '{new_id}'")
@@ -444,8 +448,8 @@ class GameGenerator:
 
         return fixed_objects, id_map
 
+    @staticmethod
     def _fix_object_locations(
-        self,
         objects: list[dict[str, Any]],
         rooms: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
@@ -487,8 +491,8 @@ class GameGenerator:
 
         return fixed_objects
 
+    @staticmethod
     def _fix_room_object_references(
-        self,
         rooms: list[dict[str, Any]],
         objects: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
@@ -526,7 +530,8 @@ class GameGenerator:
 
         return fixed_rooms
 
-    def _default_verbs(self) -> list[dict[str, Any]]:
+    @staticmethod
+    def _default_verbs() -> list[dict[str, Any]]:
         """Return default verb definitions."""
         return [
             {"verb": "take", "aliases": ["get", "grab", "pick up"], "requires_object": True},
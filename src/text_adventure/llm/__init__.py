@@ -1,8 +1,17 @@
-"""LLM client module."""
+"""LLM client module.
+
+The Anthropic client is loaded on first access: importing the anthropic SDK
+takes most of a second, and code that only needs the LLMClient interface
+(the generator transforms, the test suite) shouldn't pay for it.
+"""
+
+from typing import TYPE_CHECKING, Any
 
-from text_adventure.llm.anthropic import AnthropicClient, create_anthropic_client
 from text_adventure.llm.client import LLMClient, LLMMessage, LLMRequest, LLMResponse
 
+if TYPE_CHECKING:
+    from text_adventure.llm.anthropic import AnthropicClient, create_anthropic_client
+
 __all__ = [
     "AnthropicClient",
     "LLMClient",
@@ -11,3 +20,13 @@ __all__ = [
     "LLMResponse",
     "create_anthropic_client",
 ]
+
+_LAZY_ANTHROPIC = frozenset({"AnthropicClient", "create_anthropic_client"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ANTHROPIC:
+        from text_adventure.llm import anthropic
+
+        return getattr(anthropic, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -85,7 +85,7 @@ class Preposition(Enum):
     UNDER = auto()  # LOOK UNDER bed
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Command:
     """
     A fully parsed player command.
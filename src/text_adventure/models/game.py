@@ -8,19 +8,55 @@ ARCHITECTURE NOTES:
 These models define the STATIC game content - what exists in the game world.
 They are separate from GameState, which tracks MUTABLE state during play.
 The Game model is the root - it contains all rooms, objects, and verbs.
+All of them are frozen: a validated Game is never changed during play, so
+one instance can be shared freely between engines and states.
 
 Game JSON files are validated against these models when loaded.
 The generator creates games that conform to these models.
 """
 
-from typing import Any, Literal
+import sys
+from collections import defaultdict
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Literal, NamedTuple, Self
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
+class _DerivedModel(BaseModel):
+    """
+    Base for frozen models with values derived from their fields.
+
+    Derived values are cached_property attributes: computed on first use,
+    stored on the instance and never serialized. model_copy() drops them
+    when fields are updated, so a copy never serves its source's values.
+    """
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the model, dropping cached derived values if fields are updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _derived_names(type(self)):
+                copied.__dict__.pop(name, None)
+        return copied
+
+
+def _derived_names(cls: type[BaseModel]) -> list[str]:
+    """Names of the cached_property attributes defined on a model class."""
+    return [
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    ]
+
+
 class GameMetadata(BaseModel):
     """Metadata about the game itself."""
 
+    model_config = {"frozen": True}
+
     title: str = Field(..., min_length=1, max_length=100)
     author: str = Field(default="Generated")
     version: str = Field(default="1.0")
@@ -35,6 +71,8 @@ class Exit(BaseModel):
     Complex exits can have conditions (locked doors, etc.).
     """
 
+    model_config = {"frozen": True}
+
     target: str = Field(..., description="ID of the destination room")
     locked: bool = Field(default=False)
     lock_message: str = Field(
@@ -58,6 +96,8 @@ class Room(BaseModel):
     Rooms contain objects and have exits to other rooms.
     """
 
+    model_config = {"frozen": True}
+
     id: str = Field(..., min_length=1, pattern=r"^[a-z][a-z0-9_]*$")
     name: str = Field(..., min_length=1, max_length=100)
     description: str = Field(..., min_length=1)
@@ -97,7 +137,7 @@ class Room(BaseModel):
         return result
 
 
-class ObjectAction(BaseModel):
+class ObjectAction(_DerivedModel):
     """
     A custom action response for an object.
 
@@ -105,6 +145,8 @@ class ObjectAction(BaseModel):
     Complex actions can have conditions and state changes.
     """
 
+    model_config = {"frozen": True}
+
     message: str = Field(..., description="Text shown when action is performed")
     condition: str | None = Field(
         default=None,
@@ -131,8 +173,26 @@ class ObjectAction(BaseModel):
         description="Room ID to move player to",
     )
 
+    @cached_property
+    def state_change_plan(self) -> tuple[tuple[str | None, str, Any], ...]:
+        """
+        state_changes as (object_id, attribute, value) steps (not serialized).
+
+        object_id is None for flag changes, in which case attribute is
+        the flag name.
+        """
+        plan: list[tuple[str | None, str, Any]] = []
+        for key, value in self.state_changes.items():
+            if "." in key:
+                # Object state change (e.g., "door.locked") or flag (e.g., "flags.talked")
+                obj_id, attr = key.split(".", 1)
+                plan.append((None if obj_id == "flags" else obj_id, attr, value))
+            else:
+                plan.append((None, key, value))
+        return tuple(plan)
 
-class GameObject(BaseModel):
+
+class GameObject(_DerivedModel):
     """
     An interactive object in the game world.
 
@@ -141,6 +201,8 @@ class GameObject(BaseModel):
     Custom actions define special behaviors for verbs.
     """
 
+    model_config = {"frozen": True}
+
     id: str = Field(..., min_length=1, pattern=r"^[a-z][a-z0-9_]*$")
     name: str = Field(..., min_length=1, max_length=50)
     adjectives: list[str] = Field(
@@ -224,6 +286,11 @@ class GameObject(BaseModel):
             object.__setattr__(self, "lockable", True)
         return self
 
+    @cached_property
+    def name_lower(self) -> str:
+        """Lowercased, interned name used as a lookup key (not serialized)."""
+        return sys.intern(self.name.lower())
+
 
 class VerbDefinition(BaseModel):
     """
@@ -232,6 +299,8 @@ class VerbDefinition(BaseModel):
     This allows games to define custom verbs beyond the built-in set.
     """
 
+    model_config = {"frozen": True}
+
     verb: str = Field(..., min_length=1)
     aliases: list[str] = Field(default_factory=list)
     requires_object: bool = Field(default=False)
@@ -253,6 +322,8 @@ class WinCondition(BaseModel):
     Multiple condition types are supported.
     """
 
+    model_config = {"frozen": True}
+
     type: Literal["reach_room", "have_object", "flag_set", "all_of", "any_of"] = Field(
         ...,
         description="Type of win condition",
@@ -297,6 +368,8 @@ class WinCondition(BaseModel):
 class InitialState(BaseModel):
     """Initial game state when starting a new game."""
 
+    model_config = {"frozen": True}
+
     current_room: str = Field(..., description="Starting room ID")
     inventory: list[str] = Field(
         default_factory=list,
@@ -308,7 +381,15 @@ class InitialState(BaseModel):
     )
 
 
-class Game(BaseModel):
+class ObjectIndex(NamedTuple):
+    """Lookup tables over a game's objects; treated as read-only."""
+
+    by_id: dict[str, GameObject]
+    by_name: dict[str, frozenset[str]]  # lowercased name -> object IDs
+    by_adjective: dict[str, frozenset[str]]  # lowercased adjective -> object IDs
+
+
+class Game(_DerivedModel):
     """
     A complete game definition.
 
@@ -316,6 +397,8 @@ class Game(BaseModel):
     It is loaded from JSON and validated against this schema.
     """
 
+    model_config = {"frozen": True}
+
     metadata: GameMetadata
     rooms: list[Room] = Field(..., min_length=1)
     objects: list[GameObject] = Field(default_factory=list)
@@ -391,6 +474,21 @@ class Game(BaseModel):
                     for sub in condition.conditions:
                         self._validate_win_condition_refs(sub, room_ids, object_ids)
 
+    @cached_property
+    def object_index(self) -> ObjectIndex:
+        """Object lookup tables, built once per Game (not serialized)."""
+        by_name: defaultdict[str, set[str]] = defaultdict(set)
+        by_adj: defaultdict[str, set[str]] = defaultdict(set)
+        for obj in self.objects:
+            by_name[obj.name_lower].add(obj.id)
+            for adj in obj.adjectives:
+                by_adj[sys.intern(adj.lower())].add(obj.id)
+        return ObjectIndex(
+            by_id={obj.id: obj for obj in self.objects},
+            by_name={name: frozenset(ids) for name, ids in by_name.items()},
+            by_adjective={adj: frozenset(ids) for adj, ids in by_adj.items()},
+        )
+
     def get_room(self, room_id: str) -> Room | None:
         """Get a room by ID."""
         for room in self.rooms:
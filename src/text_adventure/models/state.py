@@ -163,6 +163,47 @@ class GameState(BaseModel):
 
         return visible
 
+    def visible_object_ids(self, game: Game) -> tuple[str, ...]:
+        """
+        Get IDs of all objects the player can currently interact with.
+
+        Includes, in game definition order:
+        - Objects in the current room (not hidden)
+        - Objects in the player's inventory
+        - Objects in open containers in the room or inventory
+        """
+        current_room = self.current_room
+        object_ids = {obj.id for obj in game.objects}
+        visible: list[str] = []
+
+        for obj in game.objects:
+            obj_state = self.objects.get(obj.id)
+            if not obj_state:
+                continue
+
+            # Hidden objects aren't visible
+            if obj_state.hidden:
+                continue
+
+            location = obj_state.location
+
+            # In current room or inventory
+            if location in (current_room, "inventory"):
+                visible.append(obj.id)
+                continue
+
+            # In an open container that's visible
+            if location in object_ids:
+                container_state = self.objects.get(location)
+                if (
+                    container_state
+                    and container_state.is_open
+                    and container_state.location in (current_room, "inventory")
+                ):
+                    visible.append(obj.id)
+
+        return tuple(visible)
+
     def move_object(self, object_id: str, new_location: str) -> None:
         """Move an object to a new location."""
         if object_id in self.objects:
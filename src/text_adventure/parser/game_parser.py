@@ -23,13 +23,16 @@ from text_adventure.models.command import (
     Verb,
 )
 from text_adventure.models.game import Game
-from text_adventure.parser.lexer import tokenize, tokens_to_words
+from text_adventure.parser.lexer import ARTICLES, CONJUNCTIONS, tokenize, tokens_to_words
 from text_adventure.parser.parser import (
     DIRECTION_WORDS,
     MULTI_WORD_VERBS,
     ParseResult,
 )
 
+# Single words the lexer drops or retypes, so they can't skip tokenizing
+_SPECIAL_WORDS = ARTICLES | CONJUNCTIONS
+
 
 @dataclass
 class CustomVerbInfo:
@@ -76,6 +79,12 @@ class GameParser:
             for alias in verb_def.aliases:
                 self.custom_verb_aliases[alias.lower()] = verb_def.verb.lower()
 
+        # Any custom verb word -> canonical name; canonical names win over aliases
+        self._verb_map: dict[str, str] = {
+            **self.custom_verb_aliases,
+            **{name: name for name in self.custom_verbs},
+        }
+
     def parse(self, text: str) -> ParseResult:
         """
         Parse player input, supporting both built-in and custom verbs.
@@ -91,13 +100,18 @@ class GameParser:
         if not raw_input:
             return ParseResult.fail("I beg your pardon?", raw_input)
 
-        tokens = tokenize(raw_input)
-        if not tokens:
-            return ParseResult.fail("I beg your pardon?", raw_input)
+        # Fast path: a single plain word ("look", "n", "pray") is its own token
+        word = raw_input.lower()
+        if raw_input.isascii() and raw_input.isalpha() and word not in _SPECIAL_WORDS:
+            words = [word]
+        else:
+            tokens = tokenize(raw_input)
+            if not tokens:
+                return ParseResult.fail("I beg your pardon?", raw_input)
 
-        words = tokens_to_words(tokens)
-        if not words:
-            return ParseResult.fail("I don't understand that.", raw_input)
+            words = tokens_to_words(tokens)
+            if not words:
+                return ParseResult.fail("I don't understand that.", raw_input)
 
         first_word = words[0]
         remaining = words[1:]
@@ -118,13 +132,9 @@ class GameParser:
             direction_verb = DIRECTION_WORDS[first_word]
             return ParseResult.ok(Command(verb=direction_verb, raw_input=raw_input))
 
-        # Check for custom verbs (canonical name)
-        if first_word in self.custom_verbs:
-            return self._parse_custom_verb(first_word, remaining, raw_input)
-
-        # Check for custom verb aliases
-        if first_word in self.custom_verb_aliases:
-            canonical = self.custom_verb_aliases[first_word]
+        # Check for custom verbs (canonical name or alias)
+        canonical = self._verb_map.get(first_word)
+        if canonical is not None:
             return self._parse_custom_verb(canonical, remaining, raw_input)
 
         return ParseResult.fail(
@@ -16,6 +16,7 @@ It handles:
 import re
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import lru_cache
 
 
 class TokenType(Enum):
@@ -27,7 +28,7 @@ class TokenType(Enum):
     PERIOD = auto()  # End of command (ignored)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Token:
     """A single token from lexer output."""
 
@@ -55,6 +56,11 @@ CONTRACTIONS = {
     "where's": "where is",
 }
 
+# Single-pass scanners, compiled once at import time. Every contraction
+# contains an apostrophe, so inputs without one skip the substitution.
+_CONTRACTION_RE = re.compile("|".join(re.escape(c) for c in CONTRACTIONS))
+_TOKEN_RE = re.compile(r"[,.]|[^\s,.]+")
+
 
 def tokenize(text: str) -> list[Token]:
     """
@@ -67,38 +73,40 @@ def tokenize(text: str) -> list[Token]:
     - Contraction expansion
     - Conjunction recognition
 
+    Tokens are immutable, so results are memoized per input string and
+    each call returns a fresh list over the shared tokens.
+
     Args:
         text: Raw player input
 
     Returns:
         List of Token objects
     """
+    return list(_tokenize(text))
+
+
+@lru_cache(maxsize=1024)
+def _tokenize(text: str) -> tuple[Token, ...]:
+    """Uncached tokenizer behind tokenize()."""
     # Normalize case
     text = text.lower().strip()
 
     if not text:
-        return []
+        return ()
 
     # Expand contractions
-    for contraction, expansion in CONTRACTIONS.items():
-        text = text.replace(contraction, expansion)
-
-    # Split on whitespace and punctuation, keeping punctuation as tokens
-    # This regex splits while keeping delimiters
-    parts = re.split(r"(\s+|[,.])", text)
+    if "'" in text:
+        text = _CONTRACTION_RE.sub(lambda m: CONTRACTIONS[m.group()], text)
 
+    # One scan yields words and punctuation; whitespace is never matched
     tokens: list[Token] = []
 
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-
-        original = part
+    for match in _TOKEN_RE.finditer(text):
+        part = match.group()
 
         # Handle punctuation
         if part == ",":
-            tokens.append(Token(TokenType.COMMA, ",", original))
+            tokens.append(Token(TokenType.COMMA, ",", part))
             continue
         if part == ".":
             # Period at end of command - skip it
@@ -106,7 +114,7 @@ def tokenize(text: str) -> list[Token]:
 
         # Handle conjunctions
         if part in CONJUNCTIONS:
-            tokens.append(Token(TokenType.AND, "and", original))
+            tokens.append(Token(TokenType.AND, "and", part))
             continue
 
         # Skip articles
@@ -114,9 +122,9 @@ def tokenize(text: str) -> list[Token]:
             continue
 
         # Regular word
-        tokens.append(Token(TokenType.WORD, part, original))
+        tokens.append(Token(TokenType.WORD, part, part))
 
-    return tokens
+    return tuple(tokens)
 
 
 def tokens_to_words(tokens: list[Token]) -> list[str]:
@@ -34,7 +34,7 @@ from text_adventure.models.command import (
 from text_adventure.parser.lexer import tokenize, tokens_to_words
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParseError:
     """Represents a parsing error with a user-friendly message."""
 
@@ -42,7 +42,7 @@ class ParseError:
     raw_input: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParseResult:
     """Result of parsing - either a Command or an error."""
 
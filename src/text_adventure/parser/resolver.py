@@ -17,11 +17,15 @@ It handles:
 
 from dataclasses import dataclass
 from enum import Enum, auto
+from itertools import islice
 
 from text_adventure.models.command import Command, Preposition, Verb
 from text_adventure.models.game import Game, GameObject
 from text_adventure.models.state import GameState
 
+# Most candidates listed back to the player for an ambiguous reference
+MAX_AMBIGUOUS_CHOICES = 5
+
 
 class ResolutionError(Enum):
     """Types of resolution failures."""
@@ -31,7 +35,7 @@ class ResolutionError(Enum):
     NOT_HERE = auto()  # Object exists but isn't accessible
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedCommand:
     """A command with resolved object IDs."""
 
@@ -43,15 +47,17 @@ class ResolvedCommand:
     custom_verb: str | None = None  # Canonical name for CUSTOM verbs
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolutionResult:
     """Result of resolution - either resolved command or error."""
 
     resolved: ResolvedCommand | None
     error_type: ResolutionError | None
     error_message: str | None
-    # For ambiguous results, list the matching objects
+    # For ambiguous results, list the matching objects (at most MAX_AMBIGUOUS_CHOICES)
     ambiguous_objects: list[str] | None = None
+    # True when more objects matched than ambiguous_objects lists
+    ambiguity_truncated: bool = False
 
     @property
     def success(self) -> bool:
@@ -79,12 +85,13 @@ class ResolutionResult:
 
     @classmethod
     def ambiguous(cls, object_ref: str, matches: list[GameObject]) -> "ResolutionResult":
-        names = [obj.name for obj in matches]
+        names = [obj.name for obj in islice(matches, MAX_AMBIGUOUS_CHOICES)]
         return cls(
             resolved=None,
             error_type=ResolutionError.AMBIGUOUS,
             error_message=f"Which {object_ref} do you mean?",
             ambiguous_objects=names,
+            ambiguity_truncated=len(matches) > MAX_AMBIGUOUS_CHOICES,
         )
 
 
@@ -95,6 +102,11 @@ class ObjectResolver:
         self.game = game
         self.state = state
 
+        # Lookup indexes over the static game definition, cached on the Game
+        # and shared by every resolver for it, so matching is set arithmetic
+        # instead of a scan per reference
+        self._by_id, self._by_name, self._by_adj = game.object_index
+
     def get_visible_objects(self) -> list[GameObject]:
         """
         Get all objects the player can currently interact with.
@@ -104,41 +116,7 @@ class ObjectResolver:
         - Objects in the player's inventory
         - Objects in open containers in the room or inventory
         """
-        visible: list[GameObject] = []
-        current_room = self.state.current_room
-
-        for obj in self.game.objects:
-            obj_state = self.state.objects.get(obj.id)
-            if not obj_state:
-                continue
-
-            # Hidden objects aren't visible
-            if obj_state.hidden:
-                continue
-
-            location = obj_state.location
-
-            # In current room
-            if location == current_room:
-                visible.append(obj)
-                continue
-
-            # In inventory
-            if location == "inventory":
-                visible.append(obj)
-                continue
-
-            # In an open container that's visible
-            container_def = self.game.get_object(location)
-            if container_def:
-                container_state = self.state.objects.get(location)
-                if container_state and container_state.is_open:
-                    # Check if container is visible
-                    container_loc = container_state.location
-                    if container_loc in (current_room, "inventory"):
-                        visible.append(obj)
-
-        return visible
+        return [self._by_id[obj_id] for obj_id in self.state.visible_object_ids(self.game)]
 
     def match_object(self, reference: str, objects: list[GameObject]) -> list[GameObject]:
         """
@@ -163,76 +141,48 @@ class ObjectResolver:
         if not words:
             return []
 
+        in_scope = {obj.id for obj in objects}
+
         # Try exact ID match first
-        for obj in objects:
-            if obj.id == reference.replace(" ", "_"):
-                return [obj]
+        ref_id = reference.replace(" ", "_")
+        if ref_id in in_scope and ref_id in self._by_id:
+            return [obj for obj in objects if obj.id == ref_id]
 
         # Try exact name match
-        exact_matches = [obj for obj in objects if obj.name.lower() == reference]
-        if exact_matches:
-            return exact_matches
+        exact_ids = self._by_name.get(reference, frozenset()) & in_scope
+        if exact_ids:
+            return [obj for obj in objects if obj.id in exact_ids]
 
         # Try matching with adjectives
         # Split reference into potential adjectives and noun
         # "brass key" -> adjectives=["brass"], noun="key"
         # "small brass key" -> adjectives=["small", "brass"], noun="key"
-
-        def score_match(obj: GameObject, ref_words: list[str]) -> int:
-            """
-            Score how well an object matches the reference.
-
-            Returns:
-                -1 if no match
-                0+ for matches (higher = better match)
-            """
-            obj_name_lower = obj.name.lower()
-            obj_adjectives = {a.lower() for a in obj.adjectives}
-
-            best_score = -1
-
-            # Try each possible split of ref_words into adjectives + noun
-            for noun_start in range(len(ref_words)):
-                potential_adjectives = ref_words[:noun_start]
-                potential_noun = " ".join(ref_words[noun_start:])
-
-                if not potential_noun:
-                    continue
-
-                # Check if noun matches object name
-                name_matches = obj_name_lower == potential_noun
-
-                if not name_matches:
-                    continue
-
-                # Check if all potential adjectives are in object's adjectives
-                if all(adj in obj_adjectives for adj in potential_adjectives):
-                    # Score based on number of matching adjectives
-                    # More adjectives = more specific = better match
-                    score = len(potential_adjectives)
-                    best_score = max(best_score, score)
-
-            return best_score
-
-        # Score all objects
-        scored = [(obj, score_match(obj, words)) for obj in objects]
-        scored = [(obj, score) for obj, score in scored if score >= 0]
-
-        if not scored:
+        # A name equals at most one suffix of the reference, so each object
+        # scores at most once; more adjectives = more specific = better match
+        scores: dict[str, int] = {}
+        for noun_start in range(len(words)):
+            candidates = self._by_name.get(" ".join(words[noun_start:]), frozenset()) & in_scope
+            for adj in words[:noun_start]:
+                if not candidates:
+                    break
+                candidates = candidates & self._by_adj.get(adj, frozenset())
+            for obj_id in candidates:
+                scores[obj_id] = noun_start
+
+        if not scores:
             # Try partial name match as fallback (only if single word reference)
             if len(words) == 1:
+                word = words[0]
                 partial = [
-                    obj
-                    for obj in objects
-                    if words[0] in obj.name.lower() or obj.name.lower() in words[0]
+                    obj for obj in objects if word in obj.name_lower or obj.name_lower in word
                 ]
                 if partial:
                     return partial
             return []
 
         # Return all objects with the best (highest) score
-        best_score = max(score for _, score in scored)
-        return [obj for obj, score in scored if score == best_score]
+        best_score = max(scores.values())
+        return [obj for obj in objects if scores.get(obj.id) == best_score]
 
     def resolve(self, command: Command) -> ResolutionResult:
         """
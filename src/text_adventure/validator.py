@@ -30,7 +30,7 @@ class ValidationSeverity(Enum):
     INFO = auto()  # Suggestion for improvement
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationIssue:
     """A single validation issue found in a game."""
 
@@ -82,6 +82,7 @@ class GameValidator:
         r"^inventory\.includes\(['\"][^'\"]+['\"]\)$",  # inventory.includes('x')
         r"^!\s*",  # negation prefix
     ]
+    _CONDITION_RES = tuple(re.compile(pattern) for pattern in CONDITION_PATTERNS)
 
     def __init__(self, game: Game):
         self.game = game
@@ -92,6 +93,12 @@ class GameValidator:
         self.object_ids = {obj.id for obj in game.objects}
         self.custom_verbs = {v.verb.lower() for v in game.verbs}
         self.custom_verb_aliases = {alias.lower() for v in game.verbs for alias in v.aliases}
+        self.known_verbs = (
+            self.BUILTIN_VERBS
+            | self.BUILTIN_ACTION_VERBS
+            | self.custom_verbs
+            | self.custom_verb_aliases
+        )
 
     def validate(self) -> list[ValidationIssue]:
         """
@@ -230,13 +237,7 @@ class GameValidator:
             check_part = part.lstrip("!")
 
             # Check against known patterns
-            valid = False
-            for pattern in self.CONDITION_PATTERNS:
-                if re.match(pattern, check_part):
-                    valid = True
-                    break
-
-            if not valid:
+            if not any(regex.match(check_part) for regex in self._CONDITION_RES):
                 self.issues.append(
                     ValidationIssue(
                         severity=ValidationSeverity.WARNING,
@@ -339,12 +340,7 @@ class GameValidator:
 
     def _is_known_verb(self, verb: str) -> bool:
         """Check if a verb is recognized by the engine."""
-        return (
-            verb in self.BUILTIN_VERBS
-            or verb in self.BUILTIN_ACTION_VERBS
-            or verb in self.custom_verbs
-            or verb in self.custom_verb_aliases
-        )
+        return verb in self.known_verbs
 
 
 def validate_game(game: Game) -> list[ValidationIssue]:
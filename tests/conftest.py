@@ -4,34 +4,62 @@ conftest.py
 Shared pytest fixtures for text_adventure tests.
 """
 
+import copy
 import json
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+from tests.fixtures import MINIMAL_GAME_DICT
+from text_adventure.engine.engine import GameEngine
 from text_adventure.models.game import Game
 from text_adventure.models.state import GameState
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Root fixtures that load a game definition; every game-backed fixture
+# depends on one of these, so they show up in any test's fixture closure.
+GAME_FIXTURES = frozenset(
+    {"sample_game_path", "sample_game_json", "sample_game", "minimal_game_template"}
+)
 
-@pytest.fixture
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Reject nogame tests that load a game."""
+    for item in items:
+        if item.get_closest_marker("nogame") is None:
+            continue
+        loaded = GAME_FIXTURES.intersection(getattr(item, "fixturenames", ()))
+        if loaded:
+            raise pytest.UsageError(
+                f"{item.nodeid} is marked nogame but uses {', '.join(sorted(loaded))}"
+            )
+
+
+@pytest.fixture(scope="session")
 def sample_game_path() -> Path:
     """Path to the sample game JSON file."""
     return FIXTURES_DIR / "sample_game.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_game_json(sample_game_path: Path) -> bytes:
+    """Raw sample game JSON, for pydantic's single-pass model_validate_json."""
+    return sample_game_path.read_bytes()
+
+
+@pytest.fixture(scope="session")
 def sample_game_dict(sample_game_path: Path) -> dict:
-    """Load sample game as a dictionary."""
+    """Load sample game as a dictionary (shared; tests must not mutate it)."""
     with open(sample_game_path) as f:
         return json.load(f)
 
 
-@pytest.fixture
-def sample_game(sample_game_dict: dict) -> Game:
-    """Load and validate the sample game."""
-    return Game.model_validate(sample_game_dict)
+@pytest.fixture(scope="session")
+def sample_game(sample_game_json: bytes) -> Game:
+    """The validated sample game; frozen, so one instance serves every test."""
+    return Game.model_validate_json(sample_game_json)
 
 
 @pytest.fixture
@@ -40,36 +68,86 @@ def sample_game_state(sample_game: Game) -> GameState:
     return GameState.from_game(sample_game)
 
 
+# ============================================================================
+# Engine Scenario Fixtures
+# ============================================================================
+# Engines pre-driven into common preconditions of the sample game. Short
+# scenarios are replayed on a fresh engine; longer ones are played once per
+# session and tests get an engine over a deep copy of the resulting state,
+# so they can mutate it freely.
+
+# Longest scenario that replays faster than deep-copying a memoized state
+# (a deep copy costs about as much as replaying two commands)
+_MAX_REPLAYED_COMMANDS = 2
+
+
+@pytest.fixture(scope="session")
+def engine_scenario(sample_game: Game) -> Callable[..., GameEngine]:
+    """Factory returning a fresh engine after replaying the given commands."""
+    states: dict[tuple[str, ...], GameState] = {}
+
+    def replay(commands: tuple[str, ...]) -> GameEngine:
+        engine = GameEngine(sample_game)
+        for command in commands:
+            engine.process_input(command)
+        return engine
+
+    def build(*commands: str) -> GameEngine:
+        if len(commands) <= _MAX_REPLAYED_COMMANDS:
+            return replay(commands)
+        if commands not in states:
+            states[commands] = replay(commands).state
+        return GameEngine(sample_game, states[commands].model_copy(deep=True))
+
+    return build
+
+
 @pytest.fixture
-def minimal_game_dict() -> dict:
-    """A minimal valid game for testing."""
-    return {
-        "metadata": {
-            "title": "Minimal Test Game",
-        },
-        "rooms": [
-            {
-                "id": "start",
-                "name": "Starting Room",
-                "description": "A simple room.",
-                "exits": {},
-            }
-        ],
-        "objects": [],
-        "initial_state": {
-            "current_room": "start",
-        },
-        "win_condition": {
-            "type": "reach_room",
-            "room": "start",
-        },
-    }
+def engine_at_entrance(engine_scenario: Callable[..., GameEngine]) -> GameEngine:
+    """Fresh engine at the starting room."""
+    return engine_scenario()
+
+
+@pytest.fixture
+def engine_in_kitchen(engine_scenario: Callable[..., GameEngine]) -> GameEngine:
+    """Engine after walking east into the kitchen."""
+    return engine_scenario("east")
+
+
+@pytest.fixture
+def engine_with_key(engine_scenario: Callable[..., GameEngine]) -> GameEngine:
+    """Engine at the entrance holding the brass key."""
+    return engine_scenario("take brass key")
+
+
+@pytest.fixture
+def engine_with_open_box(engine_scenario: Callable[..., GameEngine]) -> GameEngine:
+    """Engine in the kitchen holding the brass key, with the wooden box open."""
+    return engine_scenario("take brass key", "east", "open wooden box")
+
+
+@pytest.fixture(scope="session")
+def minimal_game_template() -> dict:
+    """A minimal valid game definition, shared read-only across the session."""
+    return MINIMAL_GAME_DICT
 
 
 @pytest.fixture
-def minimal_game(minimal_game_dict: dict) -> Game:
+def minimal_game_dict(minimal_game_template: dict) -> dict:
+    """A minimal valid game for testing; a private copy tests may mutate."""
+    return copy.deepcopy(minimal_game_template)
+
+
+@pytest.fixture(scope="session")
+def minimal_game_json(minimal_game_template: dict) -> bytes:
+    """The minimal game serialized to JSON bytes."""
+    return json.dumps(minimal_game_template).encode()
+
+
+@pytest.fixture(scope="session")
+def minimal_game(minimal_game_template: dict) -> Game:
     """Create minimal game from dict."""
-    return Game.model_validate(minimal_game_dict)
+    return Game.model_validate(minimal_game_template)
 
 
 # ============================================================================
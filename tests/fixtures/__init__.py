@@ -1 +1,25 @@
 """Test fixtures for text_adventure."""
+
+# A minimal valid game definition. Shared, so never mutate it: deep-copy it, or
+# build variants with dict unpacking ({**MINIMAL_GAME_DICT, "rooms": [...]}).
+MINIMAL_GAME_DICT: dict = {
+    "metadata": {
+        "title": "Minimal Test Game",
+    },
+    "rooms": [
+        {
+            "id": "start",
+            "name": "Starting Room",
+            "description": "A simple room.",
+            "exits": {},
+        }
+    ],
+    "objects": [],
+    "initial_state": {
+        "current_room": "start",
+    },
+    "win_condition": {
+        "type": "reach_room",
+        "room": "start",
+    },
+}
@@ -19,91 +19,76 @@ EDGE CASES:
 """
 
 from text_adventure.engine.engine import GameEngine
-from text_adventure.models.game import Game
+
+# Sample game object IDs checked against engine state
+BRASS_KEY = "brass_key"
+WOODEN_BOX = "wooden_box"
+RUSTY_COIN = "rusty_coin"
 
 
 class TestMovement:
     """Tests for movement commands."""
 
-    def test_move_north(self, sample_game: Game):
-        """Can move north when exit exists (after unlocking)."""
-        engine = GameEngine(sample_game)
-        # First need to unlock the door
-        # Take the key and go east to kitchen first
-        engine.process_input("take brass key")
-        engine.process_input("east")
-        engine.process_input("west")  # Back to entrance
-
-        # Now the door is still locked - need to test this differently
-        # Let's just move east which is unlocked
-        result = engine.process_input("east")
+    def test_move_through_unlocked_exit(self, engine_at_entrance: GameEngine):
+        """Can move through an unlocked exit."""
+        result = engine_at_entrance.process_input("east")
         assert not result.error
-        assert engine.state.current_room == "kitchen"
+        assert engine_at_entrance.state.current_room == "kitchen"
         assert "Kitchen" in result.message
 
-    def test_move_invalid_direction(self, sample_game: Game):
+    def test_move_invalid_direction(self, engine_at_entrance: GameEngine):
         """Cannot move in direction with no exit."""
-        engine = GameEngine(sample_game)
-        result = engine.process_input("west")
+        result = engine_at_entrance.process_input("west")
         assert result.error
         assert "can't go" in result.message.lower()
 
-    def test_move_locked_door(self, sample_game: Game):
+    def test_move_locked_door(self, engine_at_entrance: GameEngine):
         """Cannot move through locked door."""
-        engine = GameEngine(sample_game)
         # North exit is locked
-        result = engine.process_input("north")
+        result = engine_at_entrance.process_input("north")
         assert result.error
         assert "locked" in result.message.lower()
 
-    def test_movement_aliases(self, sample_game: Game):
+    def test_movement_aliases(self, engine_at_entrance: GameEngine):
         """Direction aliases work."""
-        engine = GameEngine(sample_game)
-
         # E for EAST
-        result = engine.process_input("e")
+        result = engine_at_entrance.process_input("e")
         assert not result.error
-        assert engine.state.current_room == "kitchen"
+        assert engine_at_entrance.state.current_room == "kitchen"
 
 
 class TestTakeAndDrop:
     """Tests for TAKE and DROP commands."""
 
-    def test_take_object(self, sample_game: Game):
+    def test_take_object(self, engine_at_entrance: GameEngine):
         """Can take a takeable object."""
-        engine = GameEngine(sample_game)
-        result = engine.process_input("take brass key")
+        result = engine_at_entrance.process_input("take brass key")
         assert not result.error
-        assert "brass_key" in engine.state.inventory
+        assert BRASS_KEY in engine_at_entrance.state.inventory
 
-    def test_take_scenery(self, sample_game: Game):
+    def test_take_scenery(self, engine_at_entrance: GameEngine):
         """Cannot take scenery objects."""
-        engine = GameEngine(sample_game)
-        result = engine.process_input("take coat rack")
+        result = engine_at_entrance.process_input("take coat rack")
         assert result.error
         assert "can't take" in result.message.lower()
 
-    def test_take_already_held(self, sample_game: Game):
+    def test_take_already_held(self, engine_with_key: GameEngine):
         """Cannot take object already in inventory."""
-        engine = GameEngine(sample_game)
-        engine.process_input("take brass key")
-        result = engine.process_input("take brass key")
+        result = engine_with_key.process_input("take brass key")
         assert result.error
         assert "already" in result.message.lower()
 
-    def test_drop_object(self, sample_game: Game):
+    def test_drop_object(self, engine_with_key: GameEngine):
         """Can drop an object from inventory."""
-        engine = GameEngine(sample_game)
-        engine.process_input("take brass key")
-        result = engine.process_input("drop brass key")
+        result = engine_with_key.process_input("drop brass key")
+        state = engine_with_key.state
         assert not result.error
-        assert "brass_key" not in engine.state.inventory
-        assert engine.state.objects["brass_key"].location == "entrance"
+        assert BRASS_KEY not in state.inventory
+        assert state.objects[BRASS_KEY].location == "entrance"
 
-    def test_drop_not_held(self, sample_game: Game):
+    def test_drop_not_held(self, engine_at_entrance: GameEngine):
         """Cannot drop object not in inventory."""
-        engine = GameEngine(sample_game)
-        result = engine.process_input("drop brass key")
+        result = engine_at_entrance.process_input("drop brass key")
         assert result.error
         assert "not carrying" in result.message.lower()
 
@@ -111,101 +96,76 @@ class TestTakeAndDrop:
 class TestExamine:
     """Tests for EXAMINE command."""
 
-    def test_examine_object(self, sample_game: Game):
+    def test_examine_object(self, engine_at_entrance: GameEngine):
         """Can examine an object."""
-        engine = GameEngine(sample_game)
-        result = engine.process_input("examine brass key")
+        result = engine_at_entrance.process_input("examine brass key")
         assert not result.error
         assert "engravings" in result.message.lower()
 
-    def test_examine_marks_examined(self, sample_game: Game):
+    def test_examine_marks_examined(self, engine_at_entrance: GameEngine):
         """Examining marks object as examined."""
-        engine = GameEngine(sample_game)
-        engine.process_input("examine brass key")
-        assert engine.state.objects["brass_key"].examined
+        engine_at_entrance.process_input("examine brass key")
+        assert engine_at_entrance.state.objects[BRASS_KEY].examined
 
-    def test_examine_alias_x(self, sample_game: Game):
+    def test_examine_alias_x(self, engine_at_entrance: GameEngine):
         """X is alias for EXAMINE."""
-        engine = GameEngine(sample_game)
-        result = engine.process_input("x brass key")
+        result = engine_at_entrance.process_input("x brass key")
         assert not result.error
 
 
 class TestContainers:
     """Tests for container operations."""
 
-    def test_open_container(self, sample_game: Game):
+    def test_open_container(self, engine_in_kitchen: GameEngine):
         """Can open a closed container."""
-        engine = GameEngine(sample_game)
-        engine.process_input("e")  # Go to kitchen
-        result = engine.process_input("open wooden box")
+        result = engine_in_kitchen.process_input("open wooden box")
         assert not result.error
-        assert engine.state.objects["wooden_box"].is_open
+        assert engine_in_kitchen.state.objects[WOODEN_BOX].is_open
 
-    def test_close_container(self, sample_game: Game):
+    def test_close_container(self, engine_with_open_box: GameEngine):
         """Can close an open container."""
-        engine = GameEngine(sample_game)
-        engine.process_input("e")
-        engine.process_input("open wooden box")
-        result = engine.process_input("close wooden box")
+        result = engine_with_open_box.process_input("close wooden box")
         assert not result.error
-        assert not engine.state.objects["wooden_box"].is_open
+        assert not engine_with_open_box.state.objects[WOODEN_BOX].is_open
 
-    def test_open_already_open(self, sample_game: Game):
+    def test_open_already_open(self, engine_with_open_box: GameEngine):
         """Error when opening already open container."""
-        engine = GameEngine(sample_game)
-        engine.process_input("e")
-        engine.process_input("open wooden box")
-        result = engine.process_input("open wooden box")
+        result = engine_with_open_box.process_input("open wooden box")
         assert result.error
         assert "already" in result.message.lower()
 
-    def test_take_from_open_container(self, sample_game: Game):
+    def test_take_from_open_container(self, engine_with_open_box: GameEngine):
         """Can take objects from open container."""
-        engine = GameEngine(sample_game)
-        engine.process_input("e")
-        engine.process_input("open wooden box")
-        result = engine.process_input("take rusty coin")
+        result = engine_with_open_box.process_input("take rusty coin")
         assert not result.error
-        assert "rusty_coin" in engine.state.inventory
+        assert RUSTY_COIN in engine_with_open_box.state.inventory
 
-    def test_cannot_take_from_closed_container(self, sample_game: Game):
+    def test_cannot_take_from_closed_container(self, engine_in_kitchen: GameEngine):
         """Cannot take objects from closed container."""
-        engine = GameEngine(sample_game)
-        engine.process_input("e")
         # Box is closed by default
-        result = engine.process_input("take rusty coin")
+        result = engine_in_kitchen.process_input("take rusty coin")
         assert result.error
 
 
 class TestPut:
     """Tests for PUT command."""
 
-    def test_put_in_container(self, sample_game: Game):
+    def test_put_in_container(self, engine_with_open_box: GameEngine):
         """Can put object in open container."""
-        engine = GameEngine(sample_game)
-        engine.process_input("take brass key")
-        engine.process_input("e")  # Go to kitchen
-        engine.process_input("open wooden box")
-        result = engine.process_input("put brass key in wooden box")
+        result = engine_with_open_box.process_input("put brass key in wooden box")
         assert not result.error
-        assert engine.state.objects["brass_key"].location == "wooden_box"
+        assert engine_with_open_box.state.objects[BRASS_KEY].location == WOODEN_BOX
 
-    def test_put_in_closed_container(self, sample_game: Game):
+    def test_put_in_closed_container(self, engine_with_key: GameEngine):
         """Cannot put in closed container."""
-        engine = GameEngine(sample_game)
-        engine.process_input("take brass key")
-        engine.process_input("e")
-        result = engine.process_input("put brass key in wooden box")
+        engine_with_key.process_input("e")
+        result = engine_with_key.process_input("put brass key in wooden box")
         assert result.error
         assert "closed" in result.message.lower()
 
-    def test_put_not_held(self, sample_game: Game):
+    def test_put_not_held(self, engine_with_open_box: GameEngine):
         """Cannot put object not in inventory."""
-        engine = GameEngine(sample_game)
-        engine.process_input("e")
-        engine.process_input("open wooden box")
-        result = engine.process_input("put apple in wooden box")
+        result = engine_with_open_box.process_input("put apple in wooden box")
         assert result.error
         assert "not holding" in result.message.lower()
 
@@ -213,57 +173,50 @@ class TestPut:
 class TestRead:
     """Tests for READ command."""
 
-    def test_read_readable(self, sample_game: Game):
+    def test_read_readable(self, engine_at_entrance: GameEngine):
         """Can read readable objects."""
-        engine = GameEngine(sample_game)
         # Need to get to library first - unlock door
         # This is complex, let's just test the mechanics
-        engine.state.current_room = "library"
-        result = engine.process_input("read book")
+        engine_at_entrance.state.current_room = "library"
+        result = engine_at_entrance.process_input("read book")
         assert not result.error
-        assert "secret" in result.message.lower() or "treasure" in result.message.lower()
+        msg = result.message.lower()
+        assert "secret" in msg or "treasure" in msg
 
-    def test_read_not_readable(self, sample_game: Game):
+    def test_read_not_readable(self, engine_at_entrance: GameEngine):
         """Cannot read non-readable objects."""
-        engine = GameEngine(sample_game)
-        result = engine.process_input("read brass key")
+        result = engine_at_entrance.process_input("read brass key")
         assert result.error
 
 
 class TestMetaCommands:
     """Tests for meta commands."""
 
-    def test_look(self, sample_game: Game):
+    def test_look(self, engine_at_entrance: GameEngine):
         """LOOK describes current room."""
-        engine = GameEngine(sample_game)
-        result = engine.process_input("look")
+        result = engine_at_entrance.process_input("look")
         assert not result.error
         assert "Entrance Hall" in result.message
 
-    def test_inventory_empty(self, sample_game: Game):
+    def test_inventory_empty(self, engine_at_entrance: GameEngine):
         """INVENTORY shows empty-handed message."""
-        engine = GameEngine(sample_game)
-        result = engine.process_input("inventory")
+        result = engine_at_entrance.process_input("inventory")
         assert "empty" in result.message.lower()
 
-    def test_inventory_with_items(self, sample_game: Game):
+    def test_inventory_with_items(self, engine_with_key: GameEngine):
         """INVENTORY lists carried items."""
-        engine = GameEngine(sample_game)
-        engine.process_input("take brass key")
-        result = engine.process_input("i")
+        result = engine_with_key.process_input("i")
         assert "brass key" in result.message.lower()
 
-    def test_quit(self, sample_game: Game):
+    def test_quit(self, engine_at_entrance: GameEngine):
         """QUIT ends the game."""
-        engine = GameEngine(sample_game)
-        result = engine.process_input("quit")
+        result = engine_at_entrance.process_input("quit")
         assert result.game_over
         assert not result.won
 
-    def test_help(self, sample_game: Game):
+    def test_help(self, engine_at_entrance: GameEngine):
         """HELP shows help text."""
-        engine = GameEngine(sample_game)
-        result = engine.process_input("help")
+        result = engine_at_entrance.process_input("help")
         assert "TAKE" in result.message
         assert "DROP" in result.message
 
@@ -271,24 +224,15 @@ class TestMetaCommands:
 class TestWinCondition:
     """Tests for win condition detection."""
 
-    def test_reach_room_win(self, sample_game: Game):
+    def test_reach_room_win(self, engine_at_entrance: GameEngine):
         """Win when reaching treasure room."""
-        engine = GameEngine(sample_game)
-        # Manually set player to treasure room
-        engine.state.current_room = "treasure_room"
-        # Trigger win check via any movement that succeeds
-        # Actually, win check happens after movement
-        # Let's trigger it manually
-        engine.process_input("look")
-        # Look doesn't trigger win check directly, but we can test the condition
-        # Actually we need to move INTO the room to trigger it
-        engine.state.current_room = "kitchen"  # Somewhere else
-        # Add an exit to treasure room for testing
-        # This is getting complex - let's test the win check directly
+        engine = engine_at_entrance
+        state = engine.state
+        state.current_room = "kitchen"
         win_msg = engine._check_win_condition()
         assert win_msg is None  # Not in treasure room
 
-        engine.state.current_room = "treasure_room"
+        state.current_room = "treasure_room"
         win_msg = engine._check_win_condition()
         assert win_msg is not None
         assert "Congratulations" in win_msg
@@ -297,26 +241,26 @@ class TestWinCondition:
 class TestTurnCounting:
     """Tests for turn counting."""
 
-    def test_action_increments_turns(self, sample_game: Game):
+    def test_action_increments_turns(self, engine_at_entrance: GameEngine):
         """Successful actions increment turn counter."""
-        engine = GameEngine(sample_game)
-        assert engine.state.turns == 0
+        engine = engine_at_entrance
+        state = engine.state
+        assert state.turns == 0
 
         engine.process_input("take brass key")
-        assert engine.state.turns == 1
+        assert state.turns == 1
 
         engine.process_input("drop brass key")
-        assert engine.state.turns == 2
+        assert state.turns == 2
 
-    def test_failed_action_no_turn(self, sample_game: Game):
+    def test_failed_action_no_turn(self, engine_at_entrance: GameEngine):
         """Failed actions don't increment turn counter."""
-        engine = GameEngine(sample_game)
-        engine.process_input("take nonexistent")  # Fails
-        assert engine.state.turns == 0
+        engine_at_entrance.process_input("take nonexistent")  # Fails
+        assert engine_at_entrance.state.turns == 0
 
-    def test_meta_commands_no_turn(self, sample_game: Game):
+    def test_meta_commands_no_turn(self, engine_at_entrance: GameEngine):
         """Meta commands don't increment turn counter."""
-        engine = GameEngine(sample_game)
+        engine = engine_at_entrance
         engine.process_input("look")
         engine.process_input("inventory")
         engine.process_input("help")
@@ -327,20 +271,19 @@ class TestTurnCounting:
 class TestGameOver:
     """Tests for game over state."""
 
-    def test_cannot_play_after_quit(self, sample_game: Game):
+    def test_cannot_play_after_quit(self, engine_at_entrance: GameEngine):
         """Cannot continue playing after quit."""
-        engine = GameEngine(sample_game)
-        engine.process_input("quit")
-        result = engine.process_input("take brass key")
+        engine_at_entrance.process_input("quit")
+        result = engine_at_entrance.process_input("take brass key")
         assert result.game_over
         assert "over" in result.message.lower()
 
-    def test_cannot_play_after_win(self, sample_game: Game):
+    def test_cannot_play_after_win(self, engine_at_entrance: GameEngine):
         """Cannot continue playing after winning."""
-        engine = GameEngine(sample_game)
-        engine.state.current_room = "treasure_room"
-        engine.state.end_game(won=True)
+        state = engine_at_entrance.state
+        state.current_room = "treasure_room"
+        state.end_game(won=True)
 
-        result = engine.process_input("look")
+        result = engine_at_entrance.process_input("look")
         assert result.game_over
         assert result.won
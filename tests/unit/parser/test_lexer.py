@@ -17,93 +17,123 @@ EDGE CASES:
 - Multiple conjunctions
 """
 
+import pytest
+
 from text_adventure.parser.lexer import (
+    Token,
     TokenType,
     split_on_conjunction,
     tokenize,
     tokens_to_words,
 )
 
+pytestmark = [pytest.mark.fast, pytest.mark.nogame]
+
+# Inputs whose tokens are shared through the tokenized fixture
+LITERALS = (
+    "take lamp",
+    "TAKE LAMP",
+    "THE LAMP",
+    "take the lamp",
+    "get a key",
+    "examine an apple",
+    "take lamp.",
+    "take lamp, key",
+    "take lamp and key",
+    "lamp & key",
+    "lamp and key",
+    "lamp and and key",
+    "lamp, key, sword",
+    "brass lamp",
+    "don't do that",
+)
+
+
+@pytest.fixture(scope="session")
+def tokenized() -> dict[str, tuple[Token, ...]]:
+    """
+    Tokens for each literal, computed once.
+
+    Stored as tuples of frozen Tokens, so no test can mutate a shared value.
+    (tokenize() is itself memoized; this table just keeps lookups by input.)
+    """
+    return {text: tuple(tokenize(text)) for text in LITERALS}
+
 
 class TestTokenize:
     """Tests for the tokenize function."""
 
-    def test_simple_words(self):
+    def test_simple_words(self, tokenized):
         """Simple words are tokenized correctly."""
-        tokens = tokenize("take lamp")
+        tokens = tokenized["take lamp"]
         assert len(tokens) == 2
         assert tokens[0].value == "take"
         assert tokens[1].value == "lamp"
 
-    def test_lowercasing(self):
+    def test_lowercasing(self, tokenized):
         """Input is lowercased."""
-        tokens = tokenize("TAKE LAMP")
+        tokens = tokenized["TAKE LAMP"]
         assert tokens[0].value == "take"
         assert tokens[1].value == "lamp"
 
-    def test_articles_stripped(self):
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("take the lamp", ["take", "lamp"]),
+            ("get a key", ["get", "key"]),
+            ("examine an apple", ["examine", "apple"]),
+        ],
+    )
+    def test_articles_stripped(self, tokenized, text: str, expected: list[str]):
         """Articles (a, an, the) are removed."""
-        tokens = tokenize("take the lamp")
-        assert len(tokens) == 2
-        assert tokens[0].value == "take"
-        assert tokens[1].value == "lamp"
-
-        tokens = tokenize("get a key")
-        assert len(tokens) == 2
-        assert tokens[0].value == "get"
-        assert tokens[1].value == "key"
+        assert [t.value for t in tokenized[text]] == expected
 
-        tokens = tokenize("examine an apple")
-        assert len(tokens) == 2
-        assert tokens[0].value == "examine"
-        assert tokens[1].value == "apple"
-
-    def test_conjunction_and(self):
+    def test_conjunction_and(self, tokenized):
         """'and' becomes an AND token."""
-        tokens = tokenize("take lamp and key")
+        tokens = tokenized["take lamp and key"]
         assert len(tokens) == 4
         assert tokens[0].value == "take"
         assert tokens[1].value == "lamp"
         assert tokens[2].type == TokenType.AND
         assert tokens[3].value == "key"
 
-    def test_conjunction_ampersand(self):
+    def test_conjunction_ampersand(self, tokenized):
         """'&' becomes an AND token."""
-        tokens = tokenize("lamp & key")
+        tokens = tokenized["lamp & key"]
         assert len(tokens) == 3
         assert tokens[1].type == TokenType.AND
 
-    def test_comma(self):
+    def test_comma(self, tokenized):
         """Commas become COMMA tokens."""
-        tokens = tokenize("take lamp, key")
+        tokens = tokenized["take lamp, key"]
         assert len(tokens) == 4
         assert tokens[2].type == TokenType.COMMA
 
-    def test_period_ignored(self):
+    def test_period_ignored(self, tokenized):
         """Periods at end of command are ignored."""
-        tokens = tokenize("take lamp.")
+        tokens = tokenized["take lamp."]
         assert len(tokens) == 2
         assert tokens[1].value == "lamp"
 
-    def test_empty_input(self):
+    @pytest.mark.parametrize("text", ["", "   "])
+    def test_empty_input(self, text: str):
         """Empty input returns empty list."""
-        assert tokenize("") == []
-        assert tokenize("   ") == []
+        assert tokenize(text) == []
 
     def test_only_articles(self):
         """Input with only articles returns empty list."""
         assert tokenize("the a an") == []
 
-    def test_contractions_expanded(self):
+    def test_contractions_expanded(self, tokenized):
         """Contractions are expanded."""
-        tokens = tokenize("don't do that")
+        tokens = tokenized["don't do that"]
         words = tokens_to_words(tokens)
         assert "do" in words
         assert "not" in words
 
-    def test_preserves_original(self):
+    def test_preserves_original(self, tokenized):
         """Tokens preserve original form."""
-        tokens = tokenize("THE LAMP")
+        tokens = tokenized["THE LAMP"]
         # Value is lowercased, original preserves case
         assert tokens[0].value == "lamp"
         assert tokens[0].original == "lamp"  # After lowercasing
@@ -112,9 +142,9 @@ class TestTokenize:
 class TestTokensToWords:
     """Tests for tokens_to_words helper."""
 
-    def test_extracts_words(self):
+    def test_extracts_words(self, tokenized):
         """Only word tokens are extracted."""
-        tokens = tokenize("take lamp and key")
+        tokens = tokenized["take lamp and key"]
         words = tokens_to_words(tokens)
         assert words == ["take", "lamp", "key"]
 
@@ -126,30 +156,30 @@ class TestTokensToWords:
 class TestSplitOnConjunction:
     """Tests for split_on_conjunction."""
 
-    def test_split_on_and(self):
+    def test_split_on_and(self, tokenized):
         """Splits on AND tokens."""
-        tokens = tokenize("lamp and key")
+        tokens = tokenized["lamp and key"]
         segments = split_on_conjunction(tokens)
         assert len(segments) == 2
         assert tokens_to_words(segments[0]) == ["lamp"]
         assert tokens_to_words(segments[1]) == ["key"]
 
-    def test_split_on_comma(self):
+    def test_split_on_comma(self, tokenized):
         """Splits on COMMA tokens."""
-        tokens = tokenize("lamp, key, sword")
+        tokens = tokenized["lamp, key, sword"]
         segments = split_on_conjunction(tokens)
         assert len(segments) == 3
 
-    def test_no_conjunction(self):
+    def test_no_conjunction(self, tokenized):
         """No conjunction returns single segment."""
-        tokens = tokenize("brass lamp")
+        tokens = tokenized["brass lamp"]
         segments = split_on_conjunction(tokens)
         assert len(segments) == 1
         assert tokens_to_words(segments[0]) == ["brass", "lamp"]
 
-    def test_empty_segments_removed(self):
+    def test_empty_segments_removed(self, tokenized):
         """Empty segments from consecutive conjunctions are removed."""
-        tokens = tokenize("lamp and and key")
+        tokens = tokenized["lamp and and key"]
         segments = split_on_conjunction(tokens)
         assert len(segments) == 2
 
@@ -18,10 +18,18 @@ EDGE CASES:
 - Missing required objects
 """
 
+from functools import cache
+
 import pytest
 
 from text_adventure.models.command import Preposition, Verb
-from text_adventure.parser.parser import parse
+from text_adventure.parser import parser
+
+pytestmark = [pytest.mark.fast, pytest.mark.nogame]
+
+# ParseResult is frozen and parse() is pure, so each distinct input is
+# parsed once per session and the result shared between tests.
+parse = cache(parser.parse)
 
 
 class TestDirectionCommands:
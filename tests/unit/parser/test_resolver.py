@@ -18,103 +18,111 @@ EDGE CASES:
 - Hidden objects
 """
 
+from collections.abc import Callable
+
 import pytest
 
 from text_adventure.models.command import Command, Preposition, Verb
-from text_adventure.models.game import Game
+from text_adventure.models.game import (
+    Game,
+    GameMetadata,
+    GameObject,
+    InitialState,
+    Room,
+    WinCondition,
+)
 from text_adventure.models.state import GameState
-from text_adventure.parser.resolver import ObjectResolver, ResolutionError
+from text_adventure.parser.resolver import (
+    MAX_AMBIGUOUS_CHOICES,
+    ObjectResolver,
+    ResolutionError,
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def two_keys_game() -> Game:
     """A game with two keys for ambiguity testing."""
-    return Game.model_validate(
-        {
-            "metadata": {"title": "Two Keys"},
-            "rooms": [
-                {
-                    "id": "room1",
-                    "name": "Room One",
-                    "description": "A room with two keys.",
-                    "exits": {},
-                }
-            ],
-            "objects": [
-                {
-                    "id": "brass_key",
-                    "name": "key",
-                    "adjectives": ["brass", "small"],
-                    "description": "A small brass key.",
-                    "location": "room1",
-                },
-                {
-                    "id": "silver_key",
-                    "name": "key",
-                    "adjectives": ["silver", "large"],
-                    "description": "A large silver key.",
-                    "location": "room1",
-                },
-                {
-                    "id": "lamp",
-                    "name": "lamp",
-                    "adjectives": ["brass"],
-                    "description": "A brass lamp.",
-                    "location": "room1",
-                },
-            ],
-            "initial_state": {"current_room": "room1"},
-            "win_condition": {"type": "reach_room", "room": "room1"},
-        }
+    return Game(
+        metadata=GameMetadata(title="Two Keys"),
+        rooms=[Room(id="room1", name="Room One", description="A room with two keys.")],
+        objects=[
+            GameObject(
+                id="brass_key",
+                name="key",
+                adjectives=["brass", "small"],
+                description="A small brass key.",
+                location="room1",
+            ),
+            GameObject(
+                id="silver_key",
+                name="key",
+                adjectives=["silver", "large"],
+                description="A large silver key.",
+                location="room1",
+            ),
+            GameObject(
+                id="lamp",
+                name="lamp",
+                adjectives=["brass"],
+                description="A brass lamp.",
+                location="room1",
+            ),
+        ],
+        initial_state=InitialState(current_room="room1"),
+        win_condition=WinCondition(type="reach_room", room="room1"),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def container_game() -> Game:
     """A game with containers for visibility testing."""
-    return Game.model_validate(
-        {
-            "metadata": {"title": "Containers"},
-            "rooms": [
-                {
-                    "id": "room1",
-                    "name": "Room",
-                    "description": "A room with a box.",
-                    "exits": {},
-                }
-            ],
-            "objects": [
-                {
-                    "id": "wooden_box",
-                    "name": "box",
-                    "adjectives": ["wooden"],
-                    "description": "A wooden box.",
-                    "location": "room1",
-                    "container": True,
-                    "openable": True,
-                    "contains": ["coin"],
-                },
-                {
-                    "id": "coin",
-                    "name": "coin",
-                    "adjectives": ["gold"],
-                    "description": "A gold coin.",
-                    "location": "wooden_box",
-                },
-            ],
-            "initial_state": {"current_room": "room1"},
-            "win_condition": {"type": "reach_room", "room": "room1"},
-        }
+    return Game(
+        metadata=GameMetadata(title="Containers"),
+        rooms=[Room(id="room1", name="Room", description="A room with a box.")],
+        objects=[
+            GameObject(
+                id="wooden_box",
+                name="box",
+                adjectives=["wooden"],
+                description="A wooden box.",
+                location="room1",
+                container=True,
+                openable=True,
+                contains=["coin"],
+            ),
+            GameObject(
+                id="coin",
+                name="coin",
+                adjectives=["gold"],
+                description="A gold coin.",
+                location="wooden_box",
+            ),
+        ],
+        initial_state=InitialState(current_room="room1"),
+        win_condition=WinCondition(type="reach_room", room="room1"),
     )
 
 
+ResolverFactory = Callable[[Game], tuple[GameState, ObjectResolver]]
+
+
+@pytest.fixture
+def resolver_for() -> ResolverFactory:
+    """Factory returning a fresh initial state and a resolver over it for a game."""
+
+    def build(game: Game) -> tuple[GameState, ObjectResolver]:
+        state = GameState.from_game(game)
+        return state, ObjectResolver(game, state)
+
+    return build
+
+
 class TestBasicResolution:
     """Tests for basic object resolution."""
 
-    def test_exact_name_match(self, two_keys_game: Game):
+    def test_exact_name_match(self, two_keys_game: Game, resolver_for: ResolverFactory):
         """Exact name match works."""
-        state = GameState.from_game(two_keys_game)
-        resolver = ObjectResolver(two_keys_game, state)
+        state, resolver = resolver_for(two_keys_game)
 
         cmd = Command(verb=Verb.TAKE, direct_object="lamp")
         result = resolver.resolve(cmd)
@@ -123,10 +131,9 @@ class TestBasicResolution:
         assert result.resolved is not None
         assert result.resolved.direct_object_id == "lamp"
 
-    def test_adjective_match(self, two_keys_game: Game):
+    def test_adjective_match(self, two_keys_game: Game, resolver_for: ResolverFactory):
         """Adjective + name match works."""
-        state = GameState.from_game(two_keys_game)
-        resolver = ObjectResolver(two_keys_game, state)
+        state, resolver = resolver_for(two_keys_game)
 
         cmd = Command(verb=Verb.TAKE, direct_object="brass key")
         result = resolver.resolve(cmd)
@@ -134,10 +141,9 @@ class TestBasicResolution:
         assert result.success
         assert result.resolved.direct_object_id == "brass_key"
 
-    def test_multiple_adjectives(self, two_keys_game: Game):
+    def test_multiple_adjectives(self, two_keys_game: Game, resolver_for: ResolverFactory):
         """Multiple adjectives work."""
-        state = GameState.from_game(two_keys_game)
-        resolver = ObjectResolver(two_keys_game, state)
+        state, resolver = resolver_for(two_keys_game)
 
         cmd = Command(verb=Verb.TAKE, direct_object="small brass key")
         result = resolver.resolve(cmd)
@@ -145,10 +151,9 @@ class TestBasicResolution:
         assert result.success
         assert result.resolved.direct_object_id == "brass_key"
 
-    def test_id_match(self, two_keys_game: Game):
+    def test_id_match(self, two_keys_game: Game, resolver_for: ResolverFactory):
         """Exact ID match works."""
-        state = GameState.from_game(two_keys_game)
-        resolver = ObjectResolver(two_keys_game, state)
+        state, resolver = resolver_for(two_keys_game)
 
         cmd = Command(verb=Verb.TAKE, direct_object="brass_key")
         result = resolver.resolve(cmd)
@@ -160,10 +165,9 @@ class TestBasicResolution:
 class TestAmbiguity:
     """Tests for ambiguous object resolution."""
 
-    def test_ambiguous_name(self, two_keys_game: Game):
+    def test_ambiguous_name(self, two_keys_game: Game, resolver_for: ResolverFactory):
         """Ambiguous name produces error."""
-        state = GameState.from_game(two_keys_game)
-        resolver = ObjectResolver(two_keys_game, state)
+        state, resolver = resolver_for(two_keys_game)
 
         cmd = Command(verb=Verb.TAKE, direct_object="key")
         result = resolver.resolve(cmd)
@@ -173,11 +177,32 @@ class TestAmbiguity:
         assert "which" in result.error_message.lower()
         assert result.ambiguous_objects is not None
         assert len(result.ambiguous_objects) == 2
+        assert not result.ambiguity_truncated
+
+    def test_ambiguous_list_truncated(self, resolver_for: ResolverFactory):
+        """Only the first few candidates of a large ambiguous match are listed."""
+        coins = [
+            GameObject(id=f"coin{i}", name="coin", description="A coin.", location="room1")
+            for i in range(MAX_AMBIGUOUS_CHOICES + 2)
+        ]
+        game = Game(
+            metadata=GameMetadata(title="Hoard"),
+            rooms=[Room(id="room1", name="Vault", description="Coins everywhere.")],
+            objects=coins,
+            initial_state=InitialState(current_room="room1"),
+            win_condition=WinCondition(type="reach_room", room="room1"),
+        )
+        _, resolver = resolver_for(game)
+
+        result = resolver.resolve(Command(verb=Verb.TAKE, direct_object="coin"))
+
+        assert result.error_type == ResolutionError.AMBIGUOUS
+        assert result.ambiguous_objects == ["coin"] * MAX_AMBIGUOUS_CHOICES
+        assert result.ambiguity_truncated
 
-    def test_adjective_disambiguates(self, two_keys_game: Game):
+    def test_adjective_disambiguates(self, two_keys_game: Game, resolver_for: ResolverFactory):
         """Adjective resolves ambiguity."""
-        state = GameState.from_game(two_keys_game)
-        resolver = ObjectResolver(two_keys_game, state)
+        state, resolver = resolver_for(two_keys_game)
 
         cmd = Command(verb=Verb.TAKE, direct_object="silver key")
         result = resolver.resolve(cmd)
@@ -189,10 +214,9 @@ class TestAmbiguity:
 class TestNotFound:
     """Tests for objects not found."""
 
-    def test_nonexistent_object(self, two_keys_game: Game):
+    def test_nonexistent_object(self, two_keys_game: Game, resolver_for: ResolverFactory):
         """Nonexistent object produces error."""
-        state = GameState.from_game(two_keys_game)
-        resolver = ObjectResolver(two_keys_game, state)
+        state, resolver = resolver_for(two_keys_game)
 
         cmd = Command(verb=Verb.TAKE, direct_object="sword")
         result = resolver.resolve(cmd)
@@ -201,11 +225,10 @@ class TestNotFound:
         assert result.error_type == ResolutionError.NOT_FOUND
         assert "sword" in result.error_message.lower()
 
-    def test_object_in_other_room(self, sample_game: Game):
+    def test_object_in_other_room(self, sample_game: Game, resolver_for: ResolverFactory):
         """Object in another room is not visible."""
-        state = GameState.from_game(sample_game)
+        state, resolver = resolver_for(sample_game)
         # Player is in entrance, silver_key is in pantry
-        resolver = ObjectResolver(sample_game, state)
 
         cmd = Command(verb=Verb.TAKE, direct_object="silver key")
         result = resolver.resolve(cmd)
@@ -217,10 +240,9 @@ class TestNotFound:
 class TestVisibility:
     """Tests for object visibility rules."""
 
-    def test_object_in_current_room(self, sample_game: Game):
+    def test_object_in_current_room(self, sample_game: Game, resolver_for: ResolverFactory):
         """Objects in current room are visible."""
-        state = GameState.from_game(sample_game)
-        resolver = ObjectResolver(sample_game, state)
+        state, resolver = resolver_for(sample_game)
 
         cmd = Command(verb=Verb.TAKE, direct_object="brass key")
         result = resolver.resolve(cmd)
@@ -228,11 +250,10 @@ class TestVisibility:
         assert result.success
         assert result.resolved.direct_object_id == "brass_key"
 
-    def test_object_in_inventory(self, sample_game: Game):
+    def test_object_in_inventory(self, sample_game: Game, resolver_for: ResolverFactory):
         """Objects in inventory are visible."""
-        state = GameState.from_game(sample_game)
+        state, resolver = resolver_for(sample_game)
         state.add_to_inventory("brass_key")
-        resolver = ObjectResolver(sample_game, state)
 
         cmd = Command(verb=Verb.DROP, direct_object="brass key")
         result = resolver.resolve(cmd)
@@ -240,11 +261,12 @@ class TestVisibility:
         assert result.success
         assert result.resolved.direct_object_id == "brass_key"
 
-    def test_object_in_closed_container_not_visible(self, container_game: Game):
+    def test_object_in_closed_container_not_visible(
+        self, container_game: Game, resolver_for: ResolverFactory
+    ):
         """Objects in closed containers are not visible."""
-        state = GameState.from_game(container_game)
+        state, resolver = resolver_for(container_game)
         # Box is closed by default
-        resolver = ObjectResolver(container_game, state)
 
         cmd = Command(verb=Verb.TAKE, direct_object="coin")
         result = resolver.resolve(cmd)
@@ -252,11 +274,12 @@ class TestVisibility:
         assert not result.success
         assert result.error_type == ResolutionError.NOT_FOUND
 
-    def test_object_in_open_container_visible(self, container_game: Game):
+    def test_object_in_open_container_visible(
+        self, container_game: Game, resolver_for: ResolverFactory
+    ):
         """Objects in open containers are visible."""
-        state = GameState.from_game(container_game)
+        state, resolver = resolver_for(container_game)
         state.objects["wooden_box"].is_open = True
-        resolver = ObjectResolver(container_game, state)
 
         cmd = Command(verb=Verb.TAKE, direct_object="coin")
         result = resolver.resolve(cmd)
@@ -264,11 +287,10 @@ class TestVisibility:
         assert result.success
         assert result.resolved.direct_object_id == "coin"
 
-    def test_hidden_object_not_visible(self, two_keys_game: Game):
+    def test_hidden_object_not_visible(self, two_keys_game: Game, resolver_for: ResolverFactory):
         """Hidden objects are not visible."""
-        state = GameState.from_game(two_keys_game)
+        state, resolver = resolver_for(two_keys_game)
         state.objects["lamp"].hidden = True
-        resolver = ObjectResolver(two_keys_game, state)
 
         # Lamp should not be found because it's hidden
         cmd = Command(verb=Verb.TAKE, direct_object="lamp")
@@ -281,12 +303,11 @@ class TestVisibility:
 class TestIndirectObjects:
     """Tests for resolving indirect objects."""
 
-    def test_both_objects_resolved(self, container_game: Game):
+    def test_both_objects_resolved(self, container_game: Game, resolver_for: ResolverFactory):
         """Both direct and indirect objects are resolved."""
-        state = GameState.from_game(container_game)
+        state, resolver = resolver_for(container_game)
         state.objects["wooden_box"].is_open = True
         state.add_to_inventory("coin")
-        resolver = ObjectResolver(container_game, state)
 
         cmd = Command(
             verb=Verb.PUT,
@@ -300,10 +321,9 @@ class TestIndirectObjects:
         assert result.resolved.direct_object_id == "coin"
         assert result.resolved.indirect_object_id == "wooden_box"
 
-    def test_direct_not_found(self, container_game: Game):
+    def test_direct_not_found(self, container_game: Game, resolver_for: ResolverFactory):
         """Error if direct object not found."""
-        state = GameState.from_game(container_game)
-        resolver = ObjectResolver(container_game, state)
+        state, resolver = resolver_for(container_game)
 
         cmd = Command(
             verb=Verb.PUT,
@@ -316,11 +336,10 @@ class TestIndirectObjects:
         assert not result.success
         assert "gem" in result.error_message.lower()
 
-    def test_indirect_not_found(self, container_game: Game):
+    def test_indirect_not_found(self, container_game: Game, resolver_for: ResolverFactory):
         """Error if indirect object not found."""
-        state = GameState.from_game(container_game)
+        state, resolver = resolver_for(container_game)
         state.add_to_inventory("coin")
-        resolver = ObjectResolver(container_game, state)
 
         cmd = Command(
             verb=Verb.PUT,
@@ -337,11 +356,10 @@ class TestIndirectObjects:
 class TestResolveInContext:
     """Tests for context-aware resolution."""
 
-    def test_inventory_context(self, sample_game: Game):
+    def test_inventory_context(self, sample_game: Game, resolver_for: ResolverFactory):
         """Inventory context only searches inventory."""
-        state = GameState.from_game(sample_game)
+        state, resolver = resolver_for(sample_game)
         state.add_to_inventory("brass_key")
-        resolver = ObjectResolver(sample_game, state)
 
         # Key is in inventory
         obj_id, error = resolver.resolve_in_context("brass key", "inventory")
@@ -354,11 +372,10 @@ class TestResolveInContext:
         assert error is not None
         assert "carrying" in error.lower()
 
-    def test_room_context(self, sample_game: Game):
+    def test_room_context(self, sample_game: Game, resolver_for: ResolverFactory):
         """Room context only searches current room."""
-        state = GameState.from_game(sample_game)
+        state, resolver = resolver_for(sample_game)
         state.add_to_inventory("brass_key")
-        resolver = ObjectResolver(sample_game, state)
 
         # Coat rack is in room
         obj_id, error = resolver.resolve_in_context("coat rack", "room")
@@ -15,11 +15,19 @@ import pytest
 
 from text_adventure.engine.engine import GameEngine
 from text_adventure.models.game import Game
+from text_adventure.parser import game_parser
 from text_adventure.parser.game_parser import GameParser
 from text_adventure.validator import ValidationSeverity, validate_game
 
 
-@pytest.fixture
+class _AnyWord:
+    """Container that holds every word."""
+
+    def __contains__(self, word: object) -> bool:
+        return True
+
+
+@pytest.fixture(scope="module")
 def game_with_custom_verbs():
     """A game that defines custom verbs."""
     return Game.model_validate(
@@ -122,6 +130,36 @@ class TestGameParser:
         assert result.success
         assert result.command.verb.name == "EXAMINE"
 
+    @pytest.mark.parametrize(
+        ("text", "verb", "custom_verb", "error"),
+        [
+            ("the", None, None, "I beg your pardon?"),
+            ("and", None, None, "I don't understand that."),
+            ("LOOK", "LOOK", None, None),
+            ("Boogie", "CUSTOM", "dance", None),
+            ("café", None, None, 'I don\'t know the word "café".'),
+        ],
+        ids=["article", "conjunction", "uppercase_builtin", "custom_alias", "non_ascii"],
+    )
+    def test_single_word_matches_tokenized_path(
+        self, game_with_custom_verbs, monkeypatch, text, verb, custom_verb, error
+    ):
+        """Single words parse the same with or without the one-word fast path."""
+        parser = GameParser(game_with_custom_verbs)
+        result = parser.parse(text)
+
+        if error is None:
+            assert result.success
+            assert result.command.verb.name == verb
+            assert result.command.custom_verb == custom_verb
+        else:
+            assert not result.success
+            assert result.error.message == error
+
+        # Treat every word as special so the gate always falls through to tokenize()
+        monkeypatch.setattr(game_parser, "_SPECIAL_WORDS", _AnyWord())
+        assert parser.parse(text) == result
+
 
 class TestHandleCustom:
     """Test custom verb execution."""
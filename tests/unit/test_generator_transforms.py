@@ -16,296 +16,296 @@ EDGE CASES:
 - Empty strings, already-valid inputs, multiple issues combined
 """
 
+import copy
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 import pytest
 
 from text_adventure.generator.generator import GameGenerator
-from text_adventure.llm.client import LLMClient
-
-
-class MockLLMClient(LLMClient):
-    """Minimal mock client for testing generator methods."""
-
-    @property
-    def model_name(self) -> str:
-        return "mock"
-
-    async def complete(self, request):
-        raise NotImplementedError
 
-    async def complete_json(self, request, schema):
-        raise NotImplementedError
-
-
-@pytest.fixture
-def generator():
-    """Create a generator with a mock client for testing transform methods."""
-    return GameGenerator(MockLLMClient())
+pytestmark = pytest.mark.fast
+
+
+def _room(room_id: str, exits: dict[str, Any] | None = None, **fields: Any) -> dict[str, Any]:
+    """Raw room dict as an LLM would emit it; name and description are filler."""
+    return {"id": room_id, "name": room_id, "description": "...", "exits": exits or {}, **fields}
+
+
+def _obj(obj_id: str, location: str = "room1", **fields: Any) -> dict[str, Any]:
+    """Raw object dict as an LLM would emit it; name and description are filler."""
+    return {"id": obj_id, "name": obj_id, "description": "...", "location": location, **fields}
+
+
+# ============================================================================
+# Raw LLM output templates
+# ============================================================================
+# Built once per module and wrapped read-only. The transforms modify nested
+# dicts in place, so tests work on _fresh(template), never the template itself.
+
+_ROOM_ID_DATA = MappingProxyType(
+    {
+        "metadata": {"title": "Test", "description": "Test"},
+        "rooms": [_room("room-1")],
+        "objects": [],
+        "initial_state": {"current_room": "room-1"},
+        "win_condition": {"type": "reach_room", "room": "room-1"},
+    }
+)
+
+_INVENTORY_ID_DATA = MappingProxyType(
+    {
+        "metadata": {"title": "Test", "description": "Test"},
+        "rooms": [_room("room1")],
+        "objects": [_obj("brass-key", location="inventory")],
+        "initial_state": {"current_room": "room1", "inventory": ["brass-key"]},
+        "win_condition": {"type": "reach_room", "room": "room1"},
+    }
+)
+
+_WIN_ROOM_DATA = MappingProxyType(
+    {
+        "metadata": {"title": "Test", "description": "Test"},
+        "rooms": [_room("treasure-room")],
+        "objects": [],
+        "initial_state": {"current_room": "treasure-room"},
+        "win_condition": {"type": "reach_room", "room": "treasure-room"},
+    }
+)
+
+_WIN_OBJECT_DATA = MappingProxyType(
+    {
+        "metadata": {"title": "Test", "description": "Test"},
+        "rooms": [_room("room1")],
+        "objects": [_obj("golden-trophy")],
+        "initial_state": {"current_room": "room1"},
+        "win_condition": {"type": "have_object", "object": "golden-trophy"},
+    }
+)
+
+_MULTI_ISSUE_DATA = MappingProxyType(
+    {
+        "metadata": {"title": "Test", "description": "Test"},
+        "rooms": [
+            # ghost-object doesn't exist
+            _room("room-1", {"north": "room-2"}, objects=["brass-key", "ghost-object"]),
+            _room("room-2", {"south": "room-1"}),
+        ],
+        "objects": [
+            # Action is missing its message
+            _obj("brass-key", "room-1", actions={"use": {"state_changes": {"flags.done": True}}}),
+        ],
+        "initial_state": {"current_room": "room-1"},
+        "win_condition": {"type": "reach_room", "room": "room-2"},
+    }
+)
+
+
+def _fresh(template: Mapping[str, Any]) -> dict[str, Any]:
+    """Deep, mutable copy of a read-only template."""
+    return copy.deepcopy(dict(template))
 
 
 class TestSanitizeId:
     """Test _sanitize_id() method."""
 
-    def test_sanitize_id_with_hyphens(self, generator):
-        """Hyphens are converted to underscores."""
-        assert generator._sanitize_id("foo-bar") == "foo_bar"
-        assert generator._sanitize_id("room-1-entrance") == "room_1_entrance"
-
-    def test_sanitize_id_with_spaces(self, generator):
-        """Spaces are converted to underscores."""
-        assert generator._sanitize_id("foo bar") == "foo_bar"
-        assert generator._sanitize_id("brass key") == "brass_key"
-
-    def test_sanitize_id_starting_with_number(self, generator):
-        """IDs starting with numbers get 'obj_' prefix."""
-        assert generator._sanitize_id("7up") == "obj_7up"
-        assert generator._sanitize_id("123abc") == "obj_123abc"
-
-    def test_sanitize_id_with_special_chars(self, generator):
-        """Special characters are removed."""
-        assert generator._sanitize_id("foo@bar!") == "foobar"
-        assert generator._sanitize_id("café") == "caf"
-        assert generator._sanitize_id("item#1") == "item1"
-
-    def test_sanitize_id_empty_string(self, generator):
-        """Empty string returns 'unknown'."""
-        assert generator._sanitize_id("") == "unknown"
-
-    def test_sanitize_id_already_valid(self, generator):
-        """Valid IDs pass through unchanged."""
-        assert generator._sanitize_id("valid_id") == "valid_id"
-        assert generator._sanitize_id("room1") == "room1"
-        assert generator._sanitize_id("brass_key_123") == "brass_key_123"
-
-    def test_sanitize_id_multiple_underscores(self, generator):
-        """Multiple consecutive underscores are collapsed."""
-        assert generator._sanitize_id("foo__bar") == "foo_bar"
-        assert generator._sanitize_id("a___b___c") == "a_b_c"
-
-    def test_sanitize_id_leading_trailing_underscores(self, generator):
-        """Leading and trailing underscores are removed."""
-        assert generator._sanitize_id("_foo_") == "foo"
-        assert generator._sanitize_id("__bar__") == "bar"
-
-    def test_sanitize_id_mixed_issues(self, generator):
-        """Multiple issues are fixed together."""
-        assert generator._sanitize_id("Room-1 (Main)") == "room_1_main"
-        assert generator._sanitize_id("--foo--bar--") == "foo_bar"
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            # Hyphens and spaces become underscores
+            ("foo-bar", "foo_bar"),
+            ("room-1-entrance", "room_1_entrance"),
+            ("foo bar", "foo_bar"),
+            ("brass key", "brass_key"),
+            # Leading digits get an 'obj_' prefix
+            ("7up", "obj_7up"),
+            ("123abc", "obj_123abc"),
+            # Special characters are removed
+            ("foo@bar!", "foobar"),
+            ("café", "caf"),
+            ("item#1", "item1"),
+            # Empty string falls back to 'unknown'
+            ("", "unknown"),
+            # Valid IDs pass through unchanged
+            ("valid_id", "valid_id"),
+            ("room1", "room1"),
+            ("brass_key_123", "brass_key_123"),
+            # Consecutive underscores collapse; outer ones are stripped
+            ("foo__bar", "foo_bar"),
+            ("a___b___c", "a_b_c"),
+            ("_foo_", "foo"),
+            ("__bar__", "bar"),
+            # Several issues at once
+            ("Room-1 (Main)", "room_1_main"),
+            ("--foo--bar--", "foo_bar"),
+        ],
+        ids=repr,
+    )
+    def test_sanitize_id(self, raw, expected):
+        """Raw IDs are normalized to valid identifiers."""
+        assert GameGenerator._sanitize_id(raw) == expected
 
 
 class TestSanitizeRoomIds:
     """Test _sanitize_room_ids() method."""
 
-    def test_fixes_invalid_room_ids(self, generator):
-        """Room IDs with invalid characters are fixed."""
-        rooms = [
-            {"id": "room-1", "name": "Room 1", "description": "...", "exits": {}},
-            {"id": "room-2", "name": "Room 2", "description": "...", "exits": {}},
-        ]
-        fixed_rooms, id_map = generator._sanitize_room_ids(rooms)
-
-        assert fixed_rooms[0]["id"] == "room_1"
-        assert fixed_rooms[1]["id"] == "room_2"
-        assert id_map == {"room-1": "room_1", "room-2": "room_2"}
-
-    def test_updates_exit_string_targets(self, generator):
-        """String exit targets are updated when room IDs change."""
-        rooms = [
-            {"id": "room-1", "name": "Room 1", "description": "...", "exits": {"north": "room-2"}},
-            {"id": "room-2", "name": "Room 2", "description": "...", "exits": {"south": "room-1"}},
-        ]
-        fixed_rooms, _ = generator._sanitize_room_ids(rooms)
-
-        assert fixed_rooms[0]["exits"]["north"] == "room_2"
-        assert fixed_rooms[1]["exits"]["south"] == "room_1"
-
-    def test_updates_exit_object_targets(self, generator):
-        """Exit objects with target field are updated."""
-        rooms = [
-            {
-                "id": "room-1",
-                "name": "Room 1",
-                "description": "...",
-                "exits": {"north": {"target": "room-2", "locked": True, "lock_message": "Locked!"}},
-            },
-            {"id": "room-2", "name": "Room 2", "description": "...", "exits": {}},
-        ]
-        fixed_rooms, _ = generator._sanitize_room_ids(rooms)
-
-        assert fixed_rooms[0]["exits"]["north"]["target"] == "room_2"
-        assert fixed_rooms[0]["exits"]["north"]["locked"] is True
-
-    def test_returns_id_mapping(self, generator):
-        """Returns mapping of old IDs to new IDs."""
-        rooms = [
-            {"id": "valid_room", "name": "Valid", "description": "...", "exits": {}},
-            {"id": "invalid-room", "name": "Invalid", "description": "...", "exits": {}},
-        ]
-        _, id_map = generator._sanitize_room_ids(rooms)
-
-        # Only changed IDs are in the map
-        assert "valid_room" not in id_map
-        assert id_map["invalid-room"] == "invalid_room"
-
-    def test_preserves_valid_ids(self, generator):
-        """Valid IDs pass through unchanged."""
-        rooms = [
-            {
-                "id": "entrance",
-                "name": "Entrance",
-                "description": "...",
-                "exits": {"north": "exit"},
-            },
-            {"id": "exit", "name": "Exit", "description": "...", "exits": {"south": "entrance"}},
-        ]
-        fixed_rooms, id_map = generator._sanitize_room_ids(rooms)
-
-        assert fixed_rooms[0]["id"] == "entrance"
-        assert fixed_rooms[1]["id"] == "exit"
-        assert id_map == {}
+    @pytest.mark.parametrize(
+        ("rooms", "expected_rooms", "expected_map"),
+        [
+            (
+                [_room("room-1"), _room("room-2")],
+                [("room_1", {}), ("room_2", {})],
+                {"room-1": "room_1", "room-2": "room_2"},
+            ),
+            (
+                [_room("room-1", {"north": "room-2"}), _room("room-2", {"south": "room-1"})],
+                [("room_1", {"north": "room_2"}), ("room_2", {"south": "room_1"})],
+                {"room-1": "room_1", "room-2": "room_2"},
+            ),
+            (
+                [
+                    _room(
+                        "room-1",
+                        {"north": {"target": "room-2", "locked": True, "lock_message": "Locked!"}},
+                    ),
+                    _room("room-2"),
+                ],
+                [
+                    (
+                        "room_1",
+                        {"north": {"target": "room_2", "locked": True, "lock_message": "Locked!"}},
+                    ),
+                    ("room_2", {}),
+                ],
+                {"room-1": "room_1", "room-2": "room_2"},
+            ),
+            (
+                # Only changed IDs are in the map
+                [_room("valid_room"), _room("invalid-room")],
+                [("valid_room", {}), ("invalid_room", {})],
+                {"invalid-room": "invalid_room"},
+            ),
+            (
+                [_room("entrance", {"north": "exit"}), _room("exit", {"south": "entrance"})],
+                [("entrance", {"north": "exit"}), ("exit", {"south": "entrance"})],
+                {},
+            ),
+        ],
+        ids=[
+            "fixes_invalid_ids",
+            "updates_exit_strings",
+            "updates_exit_objects",
+            "maps_only_changed_ids",
+            "preserves_valid_ids",
+        ],
+    )
+    def test_sanitize_room_ids(self, rooms, expected_rooms, expected_map):
+        """Room IDs and exit targets are fixed; the map records each renamed ID."""
+        fixed_rooms, id_map = GameGenerator._sanitize_room_ids(rooms)
+
+        assert [(room["id"], room["exits"]) for room in fixed_rooms] == expected_rooms
+        assert id_map == expected_map
+
+
+def _refs(obj: dict[str, Any]) -> dict[str, Any]:
+    """The ID-bearing fields of a raw object dict."""
+    return {key: obj[key] for key in ("id", "location", "key_object", "contains") if key in obj}
 
 
 class TestSanitizeObjectIds:
     """Test _sanitize_object_ids() method."""
 
-    def test_fixes_invalid_object_ids(self, generator):
-        """Object IDs with invalid characters are fixed."""
-        objects = [
-            {"id": "brass-key", "name": "key", "description": "...", "location": "room1"},
-            {"id": "old book", "name": "book", "description": "...", "location": "room1"},
-        ]
-        fixed_objects, id_map = generator._sanitize_object_ids(objects, {})
-
-        assert fixed_objects[0]["id"] == "brass_key"
-        assert fixed_objects[1]["id"] == "old_book"
-        assert id_map == {"brass-key": "brass_key", "old book": "old_book"}
-
-    def test_updates_location_with_room_map(self, generator):
-        """Object locations are updated using room_id_map."""
-        objects = [
-            {"id": "key", "name": "key", "description": "...", "location": "room-1"},
-        ]
-        room_id_map = {"room-1": "room_1"}
-        fixed_objects, _ = generator._sanitize_object_ids(objects, room_id_map)
-
-        assert fixed_objects[0]["location"] == "room_1"
-
-    def test_updates_key_object_reference(self, generator):
-        """key_object references are updated."""
-        objects = [
-            {"id": "brass-key", "name": "key", "description": "...", "location": "room1"},
-            {
-                "id": "chest",
-                "name": "chest",
-                "description": "...",
-                "location": "room1",
-                "lockable": True,
-                "key_object": "brass-key",
-            },
-        ]
-        fixed_objects, _ = generator._sanitize_object_ids(objects, {})
-
-        assert fixed_objects[1]["key_object"] == "brass_key"
-
-    def test_updates_contains_references(self, generator):
-        """contains references are updated."""
-        objects = [
-            {"id": "small-coin", "name": "coin", "description": "...", "location": "chest"},
-            {
-                "id": "chest",
-                "name": "chest",
-                "description": "...",
-                "location": "room1",
-                "container": True,
-                "contains": ["small-coin"],
-            },
-        ]
-        fixed_objects, _ = generator._sanitize_object_ids(objects, {})
-
-        assert fixed_objects[1]["contains"] == ["small_coin"]
-
-    def test_returns_id_mapping(self, generator):
-        """Returns mapping of old IDs to new IDs."""
-        objects = [
-            {"id": "valid_key", "name": "key", "description": "...", "location": "room1"},
-            {"id": "invalid-key", "name": "key", "description": "...", "location": "room1"},
-        ]
-        _, id_map = generator._sanitize_object_ids(objects, {})
-
-        assert "valid_key" not in id_map
-        assert id_map["invalid-key"] == "invalid_key"
+    @pytest.mark.parametrize(
+        ("objects", "room_id_map", "expected_objects", "expected_map"),
+        [
+            (
+                [_obj("brass-key"), _obj("old book")],
+                {},
+                [
+                    {"id": "brass_key", "location": "room1"},
+                    {"id": "old_book", "location": "room1"},
+                ],
+                {"brass-key": "brass_key", "old book": "old_book"},
+            ),
+            (
+                [_obj("key", "room-1")],
+                {"room-1": "room_1"},
+                [{"id": "key", "location": "room_1"}],
+                {},
+            ),
+            (
+                [_obj("brass-key"), _obj("chest", lockable=True, key_object="brass-key")],
+                {},
+                [
+                    {"id": "brass_key", "location": "room1"},
+                    {"id": "chest", "location": "room1", "key_object": "brass_key"},
+                ],
+                {"brass-key": "brass_key"},
+            ),
+            (
+                [
+                    _obj("small-coin", "chest"),
+                    _obj("chest", container=True, contains=["small-coin"]),
+                ],
+                {},
+                [
+                    {"id": "small_coin", "location": "chest"},
+                    {"id": "chest", "location": "room1", "contains": ["small_coin"]},
+                ],
+                {"small-coin": "small_coin"},
+            ),
+            (
+                # Only changed IDs are in the map
+                [_obj("valid_key"), _obj("invalid-key")],
+                {},
+                [
+                    {"id": "valid_key", "location": "room1"},
+                    {"id": "invalid_key", "location": "room1"},
+                ],
+                {"invalid-key": "invalid_key"},
+            ),
+        ],
+        ids=[
+            "fixes_invalid_ids",
+            "updates_location_from_room_map",
+            "updates_key_object",
+            "updates_contains",
+            "maps_only_changed_ids",
+        ],
+    )
+    def test_sanitize_object_ids(self, objects, room_id_map, expected_objects, expected_map):
+        """Object IDs and their references are fixed; the map records each renamed ID."""
+        fixed_objects, id_map = GameGenerator._sanitize_object_ids(objects, room_id_map)
+
+        assert [_refs(obj) for obj in fixed_objects] == expected_objects
+        assert id_map == expected_map
 
 
 class TestFixRoomObjectReferences:
     """Test _fix_room_object_references() method."""
 
-    def test_removes_nonexistent_object_refs(self, generator):
-        """References to non-existent objects are removed."""
-        rooms = [
-            {
-                "id": "room1",
-                "name": "Room",
-                "description": "...",
-                "exits": {},
-                "objects": ["key", "ghost", "phantom"],
-            },
-        ]
-        objects = [
-            {"id": "key", "name": "key", "description": "...", "location": "room1"},
-        ]
-        fixed_rooms = generator._fix_room_object_references(rooms, objects)
-
-        assert fixed_rooms[0]["objects"] == ["key"]
-
-    def test_preserves_valid_object_refs(self, generator):
-        """Valid object references are kept."""
-        rooms = [
-            {
-                "id": "room1",
-                "name": "Room",
-                "description": "...",
-                "exits": {},
-                "objects": ["key", "lamp", "book"],
-            },
-        ]
-        objects = [
-            {"id": "key", "name": "key", "description": "...", "location": "room1"},
-            {"id": "lamp", "name": "lamp", "description": "...", "location": "room1"},
-            {"id": "book", "name": "book", "description": "...", "location": "room1"},
-        ]
-        fixed_rooms = generator._fix_room_object_references(rooms, objects)
-
-        assert fixed_rooms[0]["objects"] == ["key", "lamp", "book"]
-
-    def test_handles_empty_objects_list(self, generator):
-        """Room with empty objects list works."""
-        rooms = [
-            {"id": "room1", "name": "Room", "description": "...", "exits": {}, "objects": []},
-        ]
-        fixed_rooms = generator._fix_room_object_references(rooms, [])
-
-        assert fixed_rooms[0]["objects"] == []
-
-    def test_handles_all_invalid_refs(self, generator):
-        """Room with only invalid refs ends up with empty list."""
-        rooms = [
-            {
-                "id": "room1",
-                "name": "Room",
-                "description": "...",
-                "exits": {},
-                "objects": ["ghost1", "ghost2"],
-            },
-        ]
-        fixed_rooms = generator._fix_room_object_references(rooms, [])
-
-        assert fixed_rooms[0]["objects"] == []
-
-    def test_handles_room_without_objects_key(self, generator):
+    @pytest.mark.parametrize(
+        ("room_objects", "object_ids", "expected"),
+        [
+            (["key", "ghost", "phantom"], ["key"], ["key"]),
+            (["key", "lamp", "book"], ["key", "lamp", "book"], ["key", "lamp", "book"]),
+            ([], [], []),
+            (["ghost1", "ghost2"], [], []),
+        ],
+        ids=["removes_nonexistent", "preserves_valid", "empty_list", "all_invalid"],
+    )
+    def test_filters_object_refs(self, room_objects, object_ids, expected):
+        """Room object lists keep only references to objects that exist."""
+        rooms = [_room("room1", objects=room_objects)]
+        objects = [_obj(obj_id) for obj_id in object_ids]
+        fixed_rooms = GameGenerator._fix_room_object_references(rooms, objects)
+
+        assert fixed_rooms[0]["objects"] == expected
+
+    def test_handles_room_without_objects_key(self):
         """Room without objects key is handled."""
-        rooms = [
-            {"id": "room1", "name": "Room", "description": "...", "exits": {}},
-        ]
-        fixed_rooms = generator._fix_room_object_references(rooms, [])
+        fixed_rooms = GameGenerator._fix_room_object_references([_room("room1")], [])
 
         assert "objects" not in fixed_rooms[0] or fixed_rooms[0].get("objects") is None
 
@@ -313,182 +313,78 @@ class TestFixRoomObjectReferences:
 class TestFixObjectActions:
     """Test _fix_object_actions() method."""
 
-    def test_adds_missing_message_field(self, generator):
+    @staticmethod
+    def _fix_action(name: str, action_key: str, action_value):
+        """Run one action of a single object through _fix_object_actions()."""
+        objects = [_obj("thing", name=name, actions={action_key: action_value})]
+        return GameGenerator._fix_object_actions(objects)[0]["actions"][action_key]
+
+    @pytest.mark.parametrize(
+        ("name", "action_key", "action_value", "expected_message"),
+        [
+            (
+                "vending machine",
+                "use",
+                {"condition": "flags.ready", "state_changes": {"flags.done": True}},
+                "You use the vending machine.",
+            ),
+            # The verb is taken from "verb:target" keys
+            (
+                "brass key",
+                "use:door",
+                {"state_changes": {"door.locked": False}},
+                "You use the brass key.",
+            ),
+        ],
+        ids=["missing_message", "verb_with_target"],
+    )
+    def test_adds_default_message(self, name, action_key, action_value, expected_message):
         """Default message is added when missing."""
-        objects = [
-            {
-                "id": "machine",
-                "name": "vending machine",
-                "description": "...",
-                "location": "room1",
-                "actions": {
-                    "use": {"condition": "flags.ready", "state_changes": {"flags.done": True}},
-                },
-            }
-        ]
-        fixed_objects = generator._fix_object_actions(objects)
-
-        assert "message" in fixed_objects[0]["actions"]["use"]
-        assert "vending machine" in fixed_objects[0]["actions"]["use"]["message"]
-
-    def test_preserves_valid_action_objects(self, generator):
-        """Valid action objects are unchanged."""
-        objects = [
-            {
-                "id": "machine",
-                "name": "machine",
-                "description": "...",
-                "location": "room1",
-                "actions": {
-                    "use": {"message": "You use it.", "state_changes": {"flags.done": True}},
-                },
-            }
-        ]
-        fixed_objects = generator._fix_object_actions(objects)
-
-        assert fixed_objects[0]["actions"]["use"]["message"] == "You use it."
-
-    def test_preserves_string_actions(self, generator):
-        """String actions pass through unchanged."""
-        objects = [
-            {
-                "id": "sign",
-                "name": "sign",
-                "description": "...",
-                "location": "room1",
-                "actions": {"examine": "You see a sign."},
-            }
-        ]
-        fixed_objects = generator._fix_object_actions(objects)
-
-        assert fixed_objects[0]["actions"]["examine"] == "You see a sign."
-
-    def test_handles_object_without_actions(self, generator):
+        fixed = self._fix_action(name, action_key, action_value)
+
+        assert fixed["message"] == expected_message
+
+    @pytest.mark.parametrize(
+        "action_value",
+        [
+            {"message": "You use it.", "state_changes": {"flags.done": True}},
+            "You see a sign.",
+        ],
+        ids=["valid_action_object", "string_action"],
+    )
+    def test_preserves_valid_actions(self, action_value):
+        """Valid action objects and string actions pass through unchanged."""
+        assert self._fix_action("machine", "use", action_value) == action_value
+
+    def test_handles_object_without_actions(self):
         """Object without actions field is handled."""
-        objects = [
-            {"id": "key", "name": "key", "description": "...", "location": "room1"},
-        ]
-        fixed_objects = generator._fix_object_actions(objects)
+        fixed_objects = GameGenerator._fix_object_actions([_obj("key")])
 
         assert "actions" not in fixed_objects[0] or fixed_objects[0].get("actions") is None
 
-    def test_handles_verb_with_target_in_action_key(self, generator):
-        """Action keys like 'use:door' generate appropriate messages."""
-        objects = [
-            {
-                "id": "key",
-                "name": "brass key",
-                "description": "...",
-                "location": "room1",
-                "actions": {
-                    "use:door": {"state_changes": {"door.locked": False}},
-                },
-            }
-        ]
-        fixed_objects = generator._fix_object_actions(objects)
-
-        # Should use "use" verb from "use:door"
-        assert "use" in fixed_objects[0]["actions"]["use:door"]["message"].lower()
-
 
 class TestTransformGameData:
     """Test full _transform_game_data() integration."""
 
-    def test_updates_initial_state_current_room(self, generator):
-        """initial_state.current_room uses sanitized room ID."""
-        data = {
-            "metadata": {"title": "Test", "description": "Test"},
-            "rooms": [{"id": "room-1", "name": "Room", "description": "...", "exits": {}}],
-            "objects": [],
-            "initial_state": {"current_room": "room-1"},
-            "win_condition": {"type": "reach_room", "room": "room-1"},
-        }
-        result = generator._transform_game_data(data)
-
-        assert result["initial_state"]["current_room"] == "room_1"
-
-    def test_updates_initial_state_inventory(self, generator):
-        """initial_state.inventory uses sanitized object IDs."""
-        data = {
-            "metadata": {"title": "Test", "description": "Test"},
-            "rooms": [{"id": "room1", "name": "Room", "description": "...", "exits": {}}],
-            "objects": [
-                {"id": "brass-key", "name": "key", "description": "...", "location": "inventory"},
-            ],
-            "initial_state": {"current_room": "room1", "inventory": ["brass-key"]},
-            "win_condition": {"type": "reach_room", "room": "room1"},
-        }
-        result = generator._transform_game_data(data)
-
-        assert result["initial_state"]["inventory"] == ["brass_key"]
-
-    def test_updates_win_condition_reach_room(self, generator):
-        """win_condition.room uses sanitized room ID."""
-        data = {
-            "metadata": {"title": "Test", "description": "Test"},
-            "rooms": [
-                {"id": "treasure-room", "name": "Treasure", "description": "...", "exits": {}}
-            ],
-            "objects": [],
-            "initial_state": {"current_room": "treasure-room"},
-            "win_condition": {"type": "reach_room", "room": "treasure-room"},
-        }
-        result = generator._transform_game_data(data)
-
-        assert result["win_condition"]["room"] == "treasure_room"
-
-    def test_updates_win_condition_have_object(self, generator):
-        """win_condition.object uses sanitized object ID."""
-        data = {
-            "metadata": {"title": "Test", "description": "Test"},
-            "rooms": [{"id": "room1", "name": "Room", "description": "...", "exits": {}}],
-            "objects": [
-                {
-                    "id": "golden-trophy",
-                    "name": "trophy",
-                    "description": "...",
-                    "location": "room1",
-                },
-            ],
-            "initial_state": {"current_room": "room1"},
-            "win_condition": {"type": "have_object", "object": "golden-trophy"},
-        }
-        result = generator._transform_game_data(data)
-
-        assert result["win_condition"]["object"] == "golden_trophy"
-
-    def test_handles_multiple_issues(self, generator):
+    @pytest.mark.parametrize(
+        ("template", "section", "key", "expected"),
+        [
+            (_ROOM_ID_DATA, "initial_state", "current_room", "room_1"),
+            (_INVENTORY_ID_DATA, "initial_state", "inventory", ["brass_key"]),
+            (_WIN_ROOM_DATA, "win_condition", "room", "treasure_room"),
+            (_WIN_OBJECT_DATA, "win_condition", "object", "golden_trophy"),
+        ],
+        ids=["current_room", "inventory", "win_room", "win_object"],
+    )
+    def test_updates_state_references(self, template, section, key, expected):
+        """initial_state and win_condition use sanitized room and object IDs."""
+        result = GameGenerator._transform_game_data(_fresh(template))
+
+        assert result[section][key] == expected
+
+    def test_handles_multiple_issues(self):
         """Multiple issues are fixed together."""
-        data = {
-            "metadata": {"title": "Test", "description": "Test"},
-            "rooms": [
-                {
-                    "id": "room-1",
-                    "name": "Room",
-                    "description": "...",
-                    "exits": {"north": "room-2"},
-                    "objects": ["brass-key", "ghost-object"],  # ghost-object doesn't exist
-                },
-                {
-                    "id": "room-2",
-                    "name": "Room 2",
-                    "description": "...",
-                    "exits": {"south": "room-1"},
-                },
-            ],
-            "objects": [
-                {
-                    "id": "brass-key",
-                    "name": "key",
-                    "description": "...",
-                    "location": "room-1",
-                    "actions": {"use": {"state_changes": {"flags.done": True}}},  # Missing message
-                },
-            ],
-            "initial_state": {"current_room": "room-1"},
-            "win_condition": {"type": "reach_room", "room": "room-2"},
-        }
-        result = generator._transform_game_data(data)
+        result = GameGenerator._transform_game_data(_fresh(_MULTI_ISSUE_DATA))
 
         # Room IDs sanitized
         assert result["rooms"][0]["id"] == "room_1"
@@ -515,90 +411,44 @@ class TestTransformGameData:
 class TestFixRevealedObjectsHidden:
     """Test _fix_revealed_objects_hidden() method."""
 
-    def test_sets_hidden_on_revealed_objects(self, generator):
+    def test_sets_hidden_on_revealed_objects(self):
         """Objects that are revealed by actions should be hidden initially."""
+        use = {"message": "A key drops out.", "reveals_object": "secret_key"}
         objects = [
-            {
-                "id": "machine",
-                "name": "vending machine",
-                "description": "...",
-                "location": "room1",
-                "actions": {
-                    "use": {
-                        "message": "A key drops out.",
-                        "reveals_object": "secret_key",
-                    },
-                },
-            },
-            {
-                "id": "secret_key",
-                "name": "secret key",
-                "description": "...",
-                "location": "room1",
-                "hidden": False,  # Incorrectly not hidden
-            },
+            _obj("machine", actions={"use": use}),
+            _obj("secret_key", hidden=False),  # Incorrectly not hidden
         ]
-        fixed_objects = generator._fix_revealed_objects_hidden(objects)
+        fixed_objects = GameGenerator._fix_revealed_objects_hidden(objects)
 
         # secret_key should now be hidden
         secret_key = next(o for o in fixed_objects if o["id"] == "secret_key")
         assert secret_key["hidden"] is True
 
-    def test_preserves_already_hidden_objects(self, generator):
+    def test_preserves_already_hidden_objects(self):
         """Objects already hidden stay hidden."""
+        use = {"message": "Found it!", "reveals_object": "gem"}
         objects = [
-            {
-                "id": "machine",
-                "name": "machine",
-                "description": "...",
-                "location": "room1",
-                "actions": {
-                    "use": {"message": "Found it!", "reveals_object": "gem"},
-                },
-            },
-            {
-                "id": "gem",
-                "name": "gem",
-                "description": "...",
-                "location": "room1",
-                "hidden": True,  # Correctly hidden
-            },
+            _obj("machine", actions={"use": use}),
+            _obj("gem", hidden=True),  # Correctly hidden
         ]
-        fixed_objects = generator._fix_revealed_objects_hidden(objects)
+        fixed_objects = GameGenerator._fix_revealed_objects_hidden(objects)
 
         gem = next(o for o in fixed_objects if o["id"] == "gem")
         assert gem["hidden"] is True
 
-    def test_ignores_non_revealed_objects(self, generator):
+    def test_ignores_non_revealed_objects(self):
         """Objects not revealed by any action keep their hidden state."""
-        objects = [
-            {
-                "id": "key",
-                "name": "key",
-                "description": "...",
-                "location": "room1",
-                "hidden": False,
-            },
-            {
-                "id": "lamp",
-                "name": "lamp",
-                "description": "...",
-                "location": "room1",
-            },
-        ]
-        fixed_objects = generator._fix_revealed_objects_hidden(objects)
+        objects = [_obj("key", hidden=False), _obj("lamp")]
+        fixed_objects = GameGenerator._fix_revealed_objects_hidden(objects)
 
         key = next(o for o in fixed_objects if o["id"] == "key")
         lamp = next(o for o in fixed_objects if o["id"] == "lamp")
         assert key.get("hidden", False) is False
         assert "hidden" not in lamp or lamp.get("hidden") is False
 
-    def test_handles_objects_without_actions(self, generator):
+    def test_handles_objects_without_actions(self):
         """Objects without actions field are handled gracefully."""
-        objects = [
-            {"id": "key", "name": "key", "description": "...", "location": "room1"},
-        ]
-        fixed_objects = generator._fix_revealed_objects_hidden(objects)
+        fixed_objects = GameGenerator._fix_revealed_objects_hidden([_obj("key")])
 
         assert len(fixed_objects) == 1
         assert fixed_objects[0]["id"] == "key"
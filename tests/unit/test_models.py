@@ -20,6 +20,7 @@ EDGE CASES:
 import pytest
 from pydantic import ValidationError
 
+from tests.fixtures import MINIMAL_GAME_DICT
 from text_adventure.models.command import (
     DIRECTION_VERBS,
     VERB_ALIASES,
@@ -31,10 +32,28 @@ from text_adventure.models.game import (
     Game,
     GameMetadata,
     GameObject,
+    ObjectAction,
     Room,
     WinCondition,
 )
-from text_adventure.models.state import GameState
+from text_adventure.models.state import GameState, ObjectState
+
+# Invalid variants of the minimal game. Built once by dict unpacking, which
+# shares every untouched branch with the baseline instead of copying it.
+_BAD_INITIAL_ROOM = {
+    **MINIMAL_GAME_DICT,
+    "initial_state": {**MINIMAL_GAME_DICT["initial_state"], "current_room": "nonexistent"},
+}
+_BAD_EXIT = {
+    **MINIMAL_GAME_DICT,
+    "rooms": [{**MINIMAL_GAME_DICT["rooms"][0], "exits": {"north": "nonexistent"}}],
+}
+_BAD_LOCATION = {
+    **MINIMAL_GAME_DICT,
+    "objects": [
+        {"id": "thing", "name": "thing", "description": "A thing.", "location": "nonexistent"}
+    ],
+}
 
 
 class TestCommand:
@@ -66,23 +85,20 @@ class TestCommand:
         assert cmd.preposition == Preposition.IN
         assert cmd.indirect_object == "box"
 
-    def test_command_indirect_without_preposition_fails(self):
-        """An indirect object without preposition is invalid."""
-        with pytest.raises(ValueError, match="no preposition"):
-            Command(
-                verb=Verb.PUT,
-                direct_object="key",
-                indirect_object="box",
-            )
-
-    def test_command_preposition_without_both_objects_fails(self):
-        """A preposition requires both objects."""
-        with pytest.raises(ValueError, match="both direct and indirect"):
-            Command(
-                verb=Verb.PUT,
-                direct_object="key",
-                preposition=Preposition.IN,
-            )
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            # An indirect object needs a preposition
+            ({"direct_object": "key", "indirect_object": "box"}, "no preposition"),
+            # A preposition needs both objects
+            ({"direct_object": "key", "preposition": Preposition.IN}, "both direct and indirect"),
+        ],
+        ids=["indirect_without_preposition", "preposition_without_indirect"],
+    )
+    def test_invalid_command_rejected(self, kwargs, match):
+        """Inconsistent object/preposition combinations are invalid."""
+        with pytest.raises(ValueError, match=match):
+            Command(verb=Verb.PUT, **kwargs)
 
     def test_command_is_frozen(self):
         """Commands are immutable."""
@@ -90,19 +106,27 @@ class TestCommand:
         with pytest.raises(AttributeError):
             cmd.verb = Verb.TAKE  # type: ignore
 
-    def test_verb_aliases_exist(self):
+    @pytest.mark.parametrize(
+        ("alias", "verb"),
+        [
+            ("get", Verb.TAKE),
+            ("grab", Verb.TAKE),
+            ("n", Verb.NORTH),
+            ("x", Verb.EXAMINE),
+            ("i", Verb.INVENTORY),
+        ],
+    )
+    def test_verb_aliases_exist(self, alias, verb):
         """Verb aliases map to correct verbs."""
-        assert VERB_ALIASES["get"] == Verb.TAKE
-        assert VERB_ALIASES["grab"] == Verb.TAKE
-        assert VERB_ALIASES["n"] == Verb.NORTH
-        assert VERB_ALIASES["x"] == Verb.EXAMINE
-        assert VERB_ALIASES["i"] == Verb.INVENTORY
+        assert VERB_ALIASES[alias] == verb
 
-    def test_direction_verbs(self):
+    @pytest.mark.parametrize(
+        ("verb", "is_direction"),
+        [(Verb.NORTH, True), (Verb.UP, True), (Verb.TAKE, False)],
+    )
+    def test_direction_verbs(self, verb, is_direction):
         """Direction verbs are correctly identified."""
-        assert Verb.NORTH in DIRECTION_VERBS
-        assert Verb.UP in DIRECTION_VERBS
-        assert Verb.TAKE not in DIRECTION_VERBS
+        assert (verb in DIRECTION_VERBS) is is_direction
 
 
 class TestGameMetadata:
@@ -111,9 +135,7 @@ class TestGameMetadata:
     def test_minimal_metadata(self):
         """Minimal metadata requires only title."""
         meta = GameMetadata(title="Test Game")
-        assert meta.title == "Test Game"
-        assert meta.author == "Generated"
-        assert meta.version == "1.0"
+        assert (meta.title, meta.author, meta.version) == ("Test Game", "Generated", "1.0")
 
     def test_empty_title_fails(self):
         """Empty title is rejected."""
@@ -236,6 +258,51 @@ class TestGameObject:
         )
         assert obj.openable is True
 
+    def test_name_lower_not_serialized(self):
+        """name_lower is a derived lookup key, not part of the schema."""
+        obj = GameObject(id="lamp", name="Brass Lamp", description="A lamp.", location="room")
+        assert obj.name_lower == "brass lamp"
+        assert "name_lower" not in obj.model_dump()
+
+    def test_model_copy_recomputes_name_lower(self):
+        """Copying with a new name doesn't carry over the old name_lower."""
+        obj = GameObject(id="rack", name="coat rack", description="A rack.", location="room")
+        assert obj.name_lower == "coat rack"
+
+        renamed = obj.model_copy(update={"name": "Widget"})
+        assert renamed.name_lower == "widget"
+        assert obj.model_copy().name_lower == "coat rack"
+
+    def test_action_state_change_plan(self):
+        """Action state_changes are pre-split into object and flag steps."""
+        obj = GameObject(
+            id="lever",
+            name="lever",
+            description="A lever.",
+            location="room",
+            actions={
+                "pull": {
+                    "message": "Clunk.",
+                    "state_changes": {"door.locked": False, "flags.pulled": True, "noisy": 1},
+                }
+            },
+        )
+        action = obj.actions["pull"]
+        assert isinstance(action, ObjectAction)
+        assert action.state_change_plan == (
+            ("door", "locked", False),
+            (None, "pulled", True),
+            (None, "noisy", 1),
+        )
+
+    def test_model_copy_recomputes_state_change_plan(self):
+        """Copying with new state_changes doesn't carry over the old plan."""
+        action = ObjectAction(message="Click.", state_changes={"x": True})
+        assert action.state_change_plan == ((None, "x", True),)
+
+        copied = action.model_copy(update={"state_changes": {"door.locked": False}})
+        assert copied.state_change_plan == (("door", "locked", False),)
+
 
 class TestWinCondition:
     """Tests for WinCondition model."""
@@ -286,30 +353,30 @@ class TestGame:
         assert game.metadata.title == "Minimal Test Game"
         assert len(game.rooms) == 1
 
-    def test_invalid_initial_room_fails(self, minimal_game_dict):
-        """Invalid initial room reference is rejected."""
-        minimal_game_dict["initial_state"]["current_room"] = "nonexistent"
-        with pytest.raises(ValidationError, match="not found"):
-            Game.model_validate(minimal_game_dict)
-
-    def test_invalid_exit_reference_fails(self, minimal_game_dict):
-        """Invalid exit target is rejected."""
-        minimal_game_dict["rooms"][0]["exits"] = {"north": "nonexistent"}
-        with pytest.raises(ValidationError, match="unknown room"):
-            Game.model_validate(minimal_game_dict)
-
-    def test_invalid_object_location_fails(self, minimal_game_dict):
-        """Invalid object location is rejected."""
-        minimal_game_dict["objects"] = [
-            {
-                "id": "thing",
-                "name": "thing",
-                "description": "A thing.",
-                "location": "nonexistent",
-            }
-        ]
-        with pytest.raises(ValidationError, match="invalid location"):
-            Game.model_validate(minimal_game_dict)
+    @pytest.mark.parametrize(
+        ("json_fixture", "dict_fixture"),
+        [("sample_game_json", "sample_game_dict"), ("minimal_game_json", "minimal_game_dict")],
+    )
+    def test_json_validates_like_dict(
+        self, request: pytest.FixtureRequest, json_fixture: str, dict_fixture: str
+    ):
+        """model_validate_json on raw bytes builds the same Game as model_validate."""
+        from_json = Game.model_validate_json(request.getfixturevalue(json_fixture))
+        assert from_json == Game.model_validate(request.getfixturevalue(dict_fixture))
+
+    @pytest.mark.parametrize(
+        ("bad_game", "match"),
+        [
+            (_BAD_INITIAL_ROOM, "not found"),
+            (_BAD_EXIT, "unknown room"),
+            (_BAD_LOCATION, "invalid location"),
+        ],
+        ids=["initial_room", "exit_reference", "object_location"],
+    )
+    def test_invalid_reference_fails(self, bad_game, match):
+        """Dangling room references are rejected."""
+        with pytest.raises(ValidationError, match=match):
+            Game.model_validate(bad_game)
 
     def test_get_room(self, sample_game):
         """get_room returns the correct room."""
@@ -327,55 +394,85 @@ class TestGame:
 
         assert sample_game.get_object("nonexistent") is None
 
+    def test_object_index(self, sample_game):
+        """object_index maps IDs, lowercased names and adjectives to objects."""
+        index = sample_game.object_index
+        assert index is sample_game.object_index
+        assert index.by_id["brass_key"] is sample_game.get_object("brass_key")
+        assert index.by_name["brass key"] == {"brass_key"}
+        assert "brass_key" in index.by_adjective["brass"]
+
+    def test_model_copy_rebuilds_object_index(self, sample_game):
+        """Copying with updated fields doesn't carry over a stale object_index."""
+        assert "coat_rack" in sample_game.object_index.by_id
+
+        without_rack = sample_game.model_copy(
+            update={"objects": [obj for obj in sample_game.objects if obj.id != "coat_rack"]}
+        )
+        assert "coat_rack" not in without_rack.object_index.by_id
+
+    def test_object_index_follows_renamed_objects(self, sample_game):
+        """A Game built from renamed object copies indexes the new names."""
+        assert "brass key" in sample_game.object_index.by_name
+
+        renamed = sample_game.model_copy(
+            update={
+                "objects": [
+                    obj.model_copy(update={"name": "iron key"}) if obj.id == "brass_key" else obj
+                    for obj in sample_game.objects
+                ]
+            }
+        )
+        assert "brass key" not in renamed.object_index.by_name
+        assert renamed.object_index.by_name["iron key"] == {"brass_key"}
+
+
+@pytest.fixture(scope="module")
+def fresh_state(sample_game: Game) -> GameState:
+    """Initial state of the sample game, shared by read-only tests."""
+    return GameState.from_game(sample_game)
+
+
+@pytest.fixture
+def state(sample_game: Game) -> GameState:
+    """Initial state of the sample game that a test may mutate."""
+    return GameState.from_game(sample_game)
+
 
 class TestGameState:
     """Tests for GameState model."""
 
-    def test_from_game(self, sample_game):
+    def test_initial_state_invariants(self, fresh_state: GameState):
         """GameState initializes correctly from a Game."""
-        state = GameState.from_game(sample_game)
-
-        assert state.current_room == "entrance"
-        assert state.inventory == []
-        assert state.turns == 0
-        assert state.game_over is False
-        assert state.won is False
+        state = fresh_state
 
-    def test_initial_room_visited(self, sample_game):
-        """The starting room is marked as visited."""
-        state = GameState.from_game(sample_game)
-        assert state.rooms["entrance"].visited is True
-        assert state.rooms["library"].visited is False
+        assert (state.current_room, state.inventory, state.turns) == ("entrance", [], 0)
+        assert not state.game_over
+        assert not state.won
 
-    def test_object_states_initialized(self, sample_game):
-        """Object states are initialized from game definition."""
-        state = GameState.from_game(sample_game)
+        # The starting room is marked as visited
+        assert (state.rooms["entrance"].visited, state.rooms["library"].visited) == (True, False)
 
-        # Check brass key is at entrance (not in inventory initially)
+        # Object states come from the game definition: brass key at the
+        # entrance (not in inventory), wooden box closed
         assert state.objects["brass_key"].location == "entrance"
+        assert not state.objects["wooden_box"].is_open
 
-        # Check wooden box is closed
-        assert state.objects["wooden_box"].is_open is False
-
-    def test_get_objects_at(self, sample_game):
-        """get_objects_at returns objects at a location."""
-        state = GameState.from_game(sample_game)
-
+        # get_objects_at returns objects at a location
         entrance_objects = state.get_objects_at("entrance")
         assert "brass_key" in entrance_objects
         assert "coat_rack" in entrance_objects
 
-    def test_move_object(self, sample_game):
-        """move_object updates object location."""
-        state = GameState.from_game(sample_game)
+        # Unset flags fall back to the default
+        assert state.get_flag("nonexistent", default="missing") == "missing"
 
+    def test_move_object(self, state: GameState):
+        """move_object updates object location."""
         state.move_object("brass_key", "library")
         assert state.objects["brass_key"].location == "library"
 
-    def test_inventory_operations(self, sample_game):
+    def test_inventory_operations(self, state: GameState):
         """Inventory add/remove works correctly."""
-        state = GameState.from_game(sample_game)
-
         state.add_to_inventory("brass_key")
         assert state.is_in_inventory("brass_key")
         assert state.objects["brass_key"].location == "inventory"
@@ -384,20 +481,51 @@ class TestGameState:
         assert not state.is_in_inventory("brass_key")
         # Note: remove_from_inventory doesn't change location
 
-    def test_flags(self, sample_game):
-        """Flag get/set works."""
-        state = GameState.from_game(sample_game)
+    def test_visible_object_ids(self, state: GameState, sample_game: Game):
+        """Visible objects follow location, open and hidden changes."""
+        assert state.visible_object_ids(sample_game) == ("coat_rack", "brass_key")
+
+        state.current_room = "kitchen"
+        assert "rusty_coin" not in state.visible_object_ids(sample_game)
+
+        state.objects["wooden_box"].is_open = True
+        assert "rusty_coin" in state.visible_object_ids(sample_game)
+
+        state.objects["apple"].hidden = True
+        assert "apple" not in state.visible_object_ids(sample_game)
+
+        state.add_to_inventory("brass_key")
+        assert "brass_key" in state.visible_object_ids(sample_game)
+
+    def test_visibility_follows_game(self, state: GameState, sample_game: Game):
+        """Visibility is worked out against the Game passed in."""
+        assert state.visible_object_ids(sample_game) == ("coat_rack", "brass_key")
 
+        without_rack = sample_game.model_copy(
+            update={"objects": [obj for obj in sample_game.objects if obj.id != "coat_rack"]}
+        )
+        assert state.visible_object_ids(without_rack) == ("brass_key",)
+
+    def test_visibility_follows_objects_mapping(self, state: GameState, sample_game: Game):
+        """Replacing or deleting entries in objects changes what is visible."""
+        assert "brass_key" in state.visible_object_ids(sample_game)
+
+        replacement = ObjectState(location="nowhere")
+        state.visible_object_ids(sample_game)
+        state.objects["brass_key"] = replacement
+        assert "brass_key" not in state.visible_object_ids(sample_game)
+
+        del state.objects["coat_rack"]
+        assert state.visible_object_ids(sample_game) == ()
+
+    def test_flags(self, state: GameState):
+        """Flag get/set works."""
         assert state.get_flag("treasure_room_revealed") is False
         state.set_flag("treasure_room_revealed", True)
         assert state.get_flag("treasure_room_revealed") is True
 
-        assert state.get_flag("nonexistent", default="missing") == "missing"
-
-    def test_save_and_load(self, sample_game):
+    def test_save_and_load(self, state: GameState):
         """State can be saved and loaded."""
-        state = GameState.from_game(sample_game)
-
         # Make some changes
         state.add_to_inventory("brass_key")
         state.increment_turns()
@@ -410,22 +538,23 @@ class TestGameState:
         # Load
         loaded = GameState.from_save_dict(save_data)
 
-        assert loaded.inventory == ["brass_key"]
-        assert loaded.turns == 1
-        assert loaded.score == 10
+        assert (loaded.inventory, loaded.turns, loaded.score) == (["brass_key"], 1, 10)
         assert loaded.get_flag("custom_flag") == "value"
 
-    def test_end_game(self, sample_game):
-        """end_game sets appropriate flags."""
-        state = GameState.from_game(sample_game)
+    def test_from_save_dict_validates(self, state: GameState):
+        """Loaded save data is validated, since save files come from disk."""
+        save_data = state.to_save_dict()
+        save_data["objects"]["brass_key"]["location"] = None
+
+        with pytest.raises(ValidationError, match="location"):
+            GameState.from_save_dict(save_data)
 
+    def test_end_game(self, state: GameState, sample_game: Game):
+        """end_game sets appropriate flags."""
         state.end_game(won=True)
-        assert state.game_over is True
-        assert state.won is True
+        assert (state.game_over, state.won) == (True, True)
 
         # Test losing
         state2 = GameState.from_game(sample_game)
         state2.end_game(won=False, message="You died!")
-        assert state2.game_over is True
-        assert state2.won is False
-        assert state2.death_message == "You died!"
+        assert (state2.game_over, state2.won, state2.death_message) == (True, False, "You died!")